@@ -0,0 +1,152 @@
+"""Compare JSON serializer backends on large DocType structures.
+
+Builds synthetic structures shaped like ``generate_doctype_json`` output and
+times every available backend in compact and pretty mode. It also checks that
+compact output is identical across backends for these structures, and that
+finite floats, which the backends format differently, parse back to the same
+values.
+
+Runs without a Frappe site:
+
+    python benchmarks/bench_serializers.py --fields 300 --links 40 --repeat 20
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import time
+from datetime import datetime
+
+# Load the serializers module directly; importing the package pulls in frappe
+_SERIALIZERS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "doctype_explorer",
+    "serializers.py",
+)
+_spec = importlib.util.spec_from_file_location("serializers", _SERIALIZERS_PATH)
+serializers = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(serializers)
+
+# Backends format these differently (e.g. 1e+20 vs 1e20) but must agree on value
+FLOATS = [0.1, 1.5, -2.25, 1e20, 1e-7, 123456.789, 3.141592653589793]
+
+FIELDTYPES = ("Data", "Link", "Select", "Currency", "Date", "Check", "Small Text", "Table")
+
+
+def make_fields(count, prefix, full=False):
+    fields = []
+    for i in range(count):
+        fieldtype = FIELDTYPES[i % len(FIELDTYPES)]
+        field = {
+            "fieldname": f"{prefix}_field_{i}",
+            "label": f"{prefix.title()} Field {i} – Ünïcödé",
+            "fieldtype": fieldtype,
+            "options": f"Linked DocType {i}" if fieldtype == "Link" else None,
+            "required": i % 7 == 0,
+        }
+        if full:
+            field.update(
+                {
+                    "read_only": i % 5 == 0,
+                    "in_list_view": i % 11 == 0,
+                    "in_standard_filter": False,
+                    "in_global_search": False,
+                    "bold": False,
+                    "hidden": i % 13 == 0,
+                    "print_hide": False,
+                    "unique": False,
+                    "description": f"Description of field {i} with some explanatory text.",
+                    "default": "",
+                    "length": 140,
+                    "precision": "",
+                    "depends_on": "eval:doc.docstatus==0" if i % 9 == 0 else "",
+                }
+            )
+        fields.append(field)
+    return fields
+
+
+def make_structure(fields, links, child_tables):
+    """Build a structure shaped like generate_doctype_json output."""
+    return {
+        "doctype_name": "Benchmark DocType",
+        "module": "Benchmark",
+        "is_submittable": 1,
+        "generated_at": datetime.now(),
+        "fields": make_fields(fields, "main", full=True),
+        "linked_doctypes": {
+            f"link_{i}": {
+                "doctype_name": f"Linked DocType {i}",
+                "field_reference": f"link_{i}",
+                "label": f"Link {i}",
+                "fields": make_fields(fields // 4, f"linked_{i}"),
+            }
+            for i in range(links)
+        },
+        "child_tables": {
+            f"table_{i}": {
+                "doctype_name": f"Child DocType {i}",
+                "field_reference": f"table_{i}",
+                "label": f"Table {i}",
+                "fields": make_fields(fields // 3, f"child_{i}"),
+                "nested_links": {
+                    f"nested_{j}": {
+                        "doctype_name": f"Nested DocType {j}",
+                        "fields": make_fields(fields // 6, f"nested_{j}"),
+                    }
+                    for j in range(links // 4)
+                },
+            }
+            for i in range(child_tables)
+        },
+        "permissions": [{"role": f"Role {i}", "read": True, "write": i % 2 == 0} for i in range(20)],
+        "meta_info": {"total_fields": fields, "link_fields_count": links},
+    }
+
+
+def time_backend(structure, backend, pretty, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = serializers.dumps(structure, pretty=pretty, backend=backend)
+        timings.append(time.perf_counter() - start)
+    return timings, len(output.encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fields", type=int, nargs="+", default=[100, 300, 1000])
+    parser.add_argument("--links", type=int, default=40)
+    parser.add_argument("--child-tables", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"Backends available: {', '.join(serializers.BACKENDS)}")
+
+    for backend in serializers.BACKENDS:
+        if json.loads(serializers.dumps(FLOATS, backend=backend)) != FLOATS:
+            raise SystemExit(f"Floats do not round-trip with the {backend} backend")
+
+    print(f"{'fields':>7} {'mode':>7} {'backend':>8} {'size (KB)':>10} {'median (ms)':>12} {'min (ms)':>9}")
+
+    for fields in args.fields:
+        structure = make_structure(fields, args.links, args.child_tables)
+
+        compact = {backend: serializers.dumps(structure, backend=backend) for backend in serializers.BACKENDS}
+        if len(set(compact.values())) != 1:
+            raise SystemExit(f"Compact output differs between backends for {fields} fields")
+
+        for pretty in (False, True):
+            for backend in serializers.BACKENDS:
+                timings, size = time_backend(structure, backend, pretty, args.repeat)
+                print(
+                    f"{fields:>7} {'pretty' if pretty else 'compact':>7} {backend:>8} "
+                    f"{size / 1024:>10.1f} {statistics.median(timings) * 1000:>12.2f} "
+                    f"{min(timings) * 1000:>9.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
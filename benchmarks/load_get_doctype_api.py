@@ -0,0 +1,215 @@
+"""Load-test get_doctype_api across concurrency, depth and DocType size.
+
+Two targets are supported:
+
+* In-process (default): drives Frappe's WSGI application through a werkzeug
+  test client. Run it from the bench's ``sites`` directory with the bench
+  Python so the site is resolved from the Host header:
+
+      cd ~/frappe-bench/sites
+      ../env/bin/python ../apps/doctype_explorer/benchmarks/load_get_doctype_api.py \\
+          --site test.local --auth-key secret
+
+* HTTP: sends real requests to a running server (``bench serve`` or gunicorn):
+
+      python benchmarks/load_get_doctype_api.py --url http://127.0.0.1:8000 \\
+          --site test.local --auth-key secret --concurrency 1 8 32
+
+Every (DocType, level, concurrency) cell reports throughput and p50/p95/p99
+latency. ``--output`` saves the results as JSON. ``--baseline`` compares
+against a saved run and exits non-zero if p95 latency regressed by more than
+``--tolerance``.
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ENDPOINT = "/api/method/doctype_explorer.explorer.get_doctype_api"
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct * len(sorted_values) / 100) - 1))
+    return sorted_values[rank]
+
+
+def make_http_sender(url, site):
+    def send(params, headers):
+        request = urllib.request.Request(
+            f"{url.rstrip('/')}{ENDPOINT}?{urllib.parse.urlencode(params)}",
+            headers={**headers, "Host": site} if site else headers,
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    return send
+
+
+def make_wsgi_sender(site):
+    # Imported lazily so the HTTP target works without Frappe installed
+    from frappe.app import application
+    from werkzeug.test import Client
+
+    local = threading.local()
+
+    def send(params, headers):
+        if not hasattr(local, "client"):
+            local.client = Client(application)
+        response = local.client.get(
+            ENDPOINT, query_string=params, headers={**headers, "Host": site}
+        )
+        return response.status_code, response.get_data()
+
+    return send
+
+
+def run_cell(send, doctype, level, concurrency, requests, warmup, auth_key, pretty):
+    params = {"doctype_name": doctype, "level": level, "pretty": int(pretty)}
+    headers = {"AUTH-KEY": auth_key}
+
+    for _ in range(warmup):
+        send(params, headers)
+
+    def one(_):
+        start = time.perf_counter()
+        status, body = send(params, headers)
+        return time.perf_counter() - start, status, len(body), body
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(r[0] for r in results)
+    ok = [r for r in results if r[1] == 200]
+
+    fields = None
+    if ok:
+        try:
+            fields = json.loads(ok[0][3])["data"]["meta_info"]["total_fields"]
+        except (ValueError, KeyError, TypeError):
+            pass
+
+    return {
+        "doctype": doctype,
+        "fields": fields,
+        "level": level,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": requests - len(ok),
+        "throughput": requests / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "response_kb": statistics.mean(r[2] for r in results) / 1024,
+    }
+
+
+def print_row(row):
+    print(
+        f"{row['doctype'][:24]:<24} {row['fields'] if row['fields'] is not None else '-':>6} "
+        f"{row['level']:>5} {row['concurrency']:>5} {row['requests']:>6} {row['errors']:>6} "
+        f"{row['throughput']:>9.1f} {row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} "
+        f"{row['p99_ms']:>9.1f} {row['response_kb']:>9.1f}"
+    )
+
+
+def compare_with_baseline(results, baseline_path, tolerance):
+    """Return the cells whose p95 latency regressed beyond the tolerance."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {
+            (r["doctype"], r["level"], r["concurrency"]): r for r in json.load(f)["results"]
+        }
+
+    regressions = []
+    for row in results:
+        before = baseline.get((row["doctype"], row["level"], row["concurrency"]))
+        if before and row["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            regressions.append((row, before))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--site", required=True, help="Site name (sent as the Host header)")
+    parser.add_argument("--url", help="Base URL of a running server; omit to run in-process")
+    parser.add_argument(
+        "--auth-key",
+        default=os.environ.get("DOCTYPE_EXPLORER_AUTH_KEY"),
+        help="AUTH-KEY (default: $DOCTYPE_EXPLORER_AUTH_KEY)",
+    )
+    parser.add_argument("--doctypes", nargs="+", default=["ToDo", "User", "Sales Order"])
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=100, help="Requests per cell")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured requests per cell")
+    parser.add_argument("--compact", action="store_true", help="Request compact JSON (pretty=0)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare p95 latency with a previous --output file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 regression")
+    args = parser.parse_args()
+
+    if not args.auth_key:
+        parser.error("--auth-key or DOCTYPE_EXPLORER_AUTH_KEY is required")
+
+    send = make_http_sender(args.url, args.site) if args.url else make_wsgi_sender(args.site)
+
+    print(
+        f"{'doctype':<24} {'fields':>6} {'level':>5} {'conc':>5} {'reqs':>6} {'errors':>6} "
+        f"{'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'KB':>9}"
+    )
+    results = []
+    for doctype in args.doctypes:
+        for level in args.levels:
+            for concurrency in args.concurrency:
+                row = run_cell(
+                    send,
+                    doctype,
+                    level,
+                    concurrency,
+                    args.requests,
+                    args.warmup,
+                    args.auth_key,
+                    pretty=not args.compact,
+                )
+                results.append(row)
+                print_row(row)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"target": args.url or "in-process", "site": args.site, "results": results},
+                f,
+                indent=2,
+            )
+
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline, args.tolerance)
+        for row, before in regressions:
+            print(
+                f"REGRESSION {row['doctype']} level={row['level']} concurrency={row['concurrency']}: "
+                f"p95 {before['p95_ms']:.1f} ms -> {row['p95_ms']:.1f} ms",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Bulk schema loading for site-wide explorer features.
+
+``get_meta`` loads one DocType at a time. Site-wide features (search index,
+link graph, statistics, exports) instead read DocField, Custom Field and
+Property Setter for every DocType in a handful of queries and apply the
+property overrides in Python.
+"""
+
+import frappe
+
+LINK_FIELDTYPES = ("Link", "Table", "Table MultiSelect")
+TABLE_FIELDTYPES = ("Table", "Table MultiSelect")
+
+# Columns loaded for every field; `unique` is quoted as it is a reserved word
+FIELD_COLUMNS = (
+    "fieldname",
+    "label",
+    "fieldtype",
+    "options",
+    "reqd",
+    "`unique`",
+    "description",
+    "idx",
+)
+
+# DocField properties that Property Setters may override
+OVERRIDABLE_PROPERTIES = ("label", "fieldtype", "options", "reqd", "unique", "description")
+INT_PROPERTIES = ("reqd", "unique")
+
+
+def get_doctypes(modules=None):
+    """
+    Return basic information for all DocTypes in one query.
+
+    Args:
+        modules (list | None): Only include DocTypes from these modules
+
+    Returns:
+        list: Dicts with name, module, istable, issingle and custom, ordered by name
+    """
+    filters = {"module": ["in", list(modules)]} if modules else {}
+    return frappe.get_all(
+        "DocType",
+        filters=filters,
+        fields=["name", "module", "istable", "issingle", "custom"],
+        order_by="name asc",
+    )
+
+
+def load_fields(doctypes=None, fieldtypes=None, columns=FIELD_COLUMNS):
+    """
+    Load the fields of many DocTypes in bulk, including custom fields and
+    DocField Property Setters.
+
+    Args:
+        doctypes (list | None): DocType names (None for every DocType)
+        fieldtypes (list | None): Only include fields of these types
+        columns (tuple): Field columns to load (default: FIELD_COLUMNS)
+
+    Returns:
+        dict: DocType name -> list of field dicts (standard fields in idx order,
+        then custom fields). Custom fields have ``is_custom`` set to 1.
+    """
+    doctype_filter = ["in", list(doctypes)] if doctypes is not None else None
+    if doctypes is not None and not doctypes:
+        return {}
+
+    docfield_filters = {"parenttype": "DocType"}
+    custom_filters = {}
+    if doctype_filter:
+        docfield_filters["parent"] = doctype_filter
+        custom_filters["dt"] = doctype_filter
+    if fieldtypes:
+        docfield_filters["fieldtype"] = ["in", list(fieldtypes)]
+        custom_filters["fieldtype"] = ["in", list(fieldtypes)]
+
+    fields_by_doctype = {}
+
+    for row in frappe.get_all(
+        "DocField",
+        filters=docfield_filters,
+        fields=["parent", *columns],
+        order_by="parent asc, idx asc",
+    ):
+        row["is_custom"] = 0
+        fields_by_doctype.setdefault(row.pop("parent"), []).append(row)
+
+    for row in frappe.get_all(
+        "Custom Field",
+        filters=custom_filters,
+        fields=["dt as parent", *columns],
+        order_by="dt asc, idx asc",
+    ):
+        row["is_custom"] = 1
+        fields_by_doctype.setdefault(row.pop("parent"), []).append(row)
+
+    _apply_property_setters(fields_by_doctype, doctype_filter)
+
+    if fieldtypes:
+        for doctype, fields in fields_by_doctype.items():
+            fields_by_doctype[doctype] = [f for f in fields if f["fieldtype"] in fieldtypes]
+
+    return dict(sorted(fields_by_doctype.items()))
+
+
+def _apply_property_setters(fields_by_doctype, doctype_filter=None):
+    """Apply DocField Property Setters to bulk-loaded fields in place."""
+    filters = {"doctype_or_field": "DocField", "property": ["in", OVERRIDABLE_PROPERTIES]}
+    if doctype_filter:
+        filters["doc_type"] = doctype_filter
+
+    overrides = frappe.get_all(
+        "Property Setter",
+        filters=filters,
+        fields=["doc_type", "field_name", "property", "value"],
+    )
+    if not overrides:
+        return
+
+    fields_by_key = {
+        (doctype, f["fieldname"]): f
+        for doctype, fields in fields_by_doctype.items()
+        for f in fields
+    }
+    for ps in overrides:
+        field = fields_by_key.get((ps.doc_type, ps.field_name))
+        if field is None:
+            continue
+        value = ps.value
+        if ps.property in INT_PROPERTIES:
+            value = frappe.utils.cint(value)
+        field[ps.property] = value
@@ -0,0 +1,134 @@
+"""Redis-backed caches for DocType Explorer.
+
+Structures generated by the explorer only change when the schema changes, so
+they are cached per site and dropped from the document hooks registered in
+``hooks.py`` whenever DocType meta is touched.
+"""
+
+import frappe
+
+STRUCTURE_CACHE_KEY = "doctype_explorer|structures"
+LINK_GRAPH_CACHE_KEY = "doctype_explorer|link_graph"
+STATISTICS_CACHE_KEY = "doctype_explorer|statistics"
+PERMISSION_MATRIX_CACHE_KEY = "doctype_explorer|permission_matrix"
+PUBLISHED_ARTIFACTS_CACHE_KEY = "doctype_explorer|published_artifacts"
+
+# Every cache key derived from DocType meta; cleared together on schema changes
+SCHEMA_CACHE_KEYS = (
+    STRUCTURE_CACHE_KEY,
+    LINK_GRAPH_CACHE_KEY,
+    STATISTICS_CACHE_KEY,
+    PERMISSION_MATRIX_CACHE_KEY,
+    PUBLISHED_ARTIFACTS_CACHE_KEY,
+)
+
+
+def structure_cache_field(doctype_name, level):
+    """
+    Build the hash field used to store one generated structure.
+
+    Args:
+        doctype_name (str): DocType name
+        level (int): Requested depth (0 for infinite)
+
+    Returns:
+        str: Hash field name
+    """
+    return f"{doctype_name}::{int(level or 0)}"
+
+
+def custom_perm_stamp():
+    """
+    Return a cheap fingerprint of Custom DocPerm. The Role Permission Manager
+    updates and deletes these rows without running document hooks, so cached
+    entries that include permissions are checked against it.
+
+    Returns:
+        tuple: Row count and latest modified timestamp
+    """
+    stamp = frappe.get_all(
+        "Custom DocPerm", fields=["count(name) as count", "max(modified) as modified"]
+    )[0]
+    return (stamp.count, str(stamp.modified))
+
+
+def get_cached_structure(doctype_name, level, stamp=None):
+    """
+    Return a cached DocType structure, or None if it has not been generated yet
+    or was generated against different Custom DocPerm rows.
+
+    Args:
+        doctype_name (str): DocType name
+        level (int): Requested depth (0 for infinite)
+        stamp (tuple | None): Current ``custom_perm_stamp()`` (looked up if None)
+
+    Returns:
+        dict | None: Cached structure
+    """
+    entry = frappe.cache().hget(STRUCTURE_CACHE_KEY, structure_cache_field(doctype_name, level))
+    if entry is None:
+        return None
+    if entry.get("stamp") != (stamp or custom_perm_stamp()):
+        return None
+    return entry["structure"]
+
+
+def set_cached_structure(doctype_name, level, structure, stamp=None):
+    """
+    Store a generated DocType structure in the site cache.
+
+    Args:
+        doctype_name (str): DocType name
+        level (int): Requested depth (0 for infinite)
+        structure (dict): Structure returned by ``generate_doctype_json``
+        stamp (tuple | None): ``custom_perm_stamp()`` taken before generating
+            (looked up if None)
+    """
+    frappe.cache().hset(
+        STRUCTURE_CACHE_KEY,
+        structure_cache_field(doctype_name, level),
+        {"stamp": stamp or custom_perm_stamp(), "structure": structure},
+    )
+
+
+def release_cached_structure(doctype_name, level):
+    """
+    Drop a structure from this process's copy of the structure cache.
+
+    ``frappe.cache()`` keeps every hash value it reads or writes in
+    ``frappe.local.cache`` until the request or command ends. Site-wide runs
+    call this once a structure has been written out, so they hold one
+    structure at a time.
+
+    Args:
+        doctype_name (str): DocType name
+        level (int): Requested depth (0 for infinite)
+    """
+    local_cache = getattr(frappe.local, "cache", None)
+    if isinstance(local_cache, dict):
+        local_cache.get(frappe.cache().make_key(STRUCTURE_CACHE_KEY), {}).pop(
+            structure_cache_field(doctype_name, level), None
+        )
+
+
+def _delete_schema_cache():
+    for key in SCHEMA_CACHE_KEYS:
+        frappe.cache().delete_value(key)
+
+
+def clear_schema_cache(doc=None, method=None):
+    """
+    Drop every cached structure derived from DocType meta.
+
+    Registered as a document hook for DocType, Custom Field, Property Setter and
+    Custom DocPerm, and called after migrate. Hooks run before the change is
+    committed, so a concurrent request could cache the old schema in between;
+    the cache is cleared again once the transaction commits.
+
+    Args:
+        doc (Document | None): Document that triggered the hook
+        method (str | None): Hook method name
+    """
+    _delete_schema_cache()
+    if doc is not None:
+        frappe.db.after_commit.add(_delete_schema_cache)
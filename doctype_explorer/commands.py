@@ -0,0 +1,105 @@
+"""Bench commands for DocType Explorer."""
+
+import os
+
+import click
+import frappe
+from frappe.commands import get_site, pass_context
+
+
+@click.command("export-doctype-docs")
+@click.option("--sites", "site_names", help="Comma-separated sites (default: sites passed with --site)")
+@click.option("--module", "modules", multiple=True, help="Only export DocTypes of this module (repeatable)")
+@click.option("--level", type=int, default=1, show_default=True, help="Depth (0 for infinite)")
+@click.option("--processes", type=int, default=None, help="Worker processes (default: CPU count)")
+@pass_context
+def export_doctype_docs(context, site_names=None, modules=None, level=1, processes=None):
+    """
+    Export DocType documentation for many sites in parallel.
+
+    Usage: bench --site all export-doctype-docs --processes 8
+    """
+    from doctype_explorer.multisite import export_sites
+
+    sites = [s.strip() for s in site_names.split(",") if s.strip()] if site_names else context.sites
+    if not sites:
+        raise click.UsageError("Pass --site all, --site <site> or --sites <site1,site2>")
+
+    summary = export_sites(
+        sites,
+        sites_path=os.getcwd(),
+        modules=list(modules) or None,
+        level=level,
+        processes=processes,
+    )
+
+    for site, result in summary.items():
+        if result.get("error"):
+            click.secho(f"{site}: {result['error']}", fg="red")
+            continue
+        click.echo(
+            f"{site}: {result['total']} DocTypes, {result['generated']} generated, "
+            f"{result['shared']} shared, {result['failed']} failed"
+        )
+        for doctype, error in result["errors"].items():
+            click.secho(f"  {doctype}: {error}", fg="red")
+
+
+@click.command("stream-doctype-docs")
+@click.option("--module", "modules", multiple=True, help="Only stream DocTypes of this module (repeatable)")
+@click.option("--doctype", "doctypes", multiple=True, help="Stream this DocType (repeatable)")
+@click.option("--level", type=int, default=1, show_default=True, help="Depth (0 for infinite)")
+@click.option("--output", default="-", show_default=True, help="File to write; - for stdout")
+@click.option("--buffer-size", type=int, default=64 * 1024, show_default=True, help="Write buffer in bytes")
+@pass_context
+def stream_doctype_docs(context, modules=None, doctypes=None, level=1, output="-", buffer_size=65536):
+    """
+    Write newline-delimited JSON, one compact DocType structure per line.
+
+    Usage: bench --site mysite stream-doctype-docs --module Selling | jq .doctype_name
+    """
+    from doctype_explorer.explorer import stream_doctype_documentation
+
+    frappe.init(site=get_site(context))
+    frappe.connect()
+    try:
+        written = stream_doctype_documentation(
+            doctypes=list(doctypes) or None,
+            module=list(modules) or None,
+            level=level,
+            output=output,
+            buffer_size=buffer_size,
+        )
+    finally:
+        frappe.destroy()
+
+    # Keep stdout clean for the records; report on stderr
+    click.echo(f"{written} DocTypes written", err=True)
+
+
+@click.command("export-doctype-sqlite")
+@click.option("--output", default=None, help="SQLite file (default: private/files/doctype_docs/schema.sqlite3)")
+@pass_context
+def export_doctype_sqlite(context, output=None):
+    """
+    Export the site's DocTypes, fields, links, child tables and permissions to
+    an indexed SQLite file.
+
+    Usage: bench --site mysite export-doctype-sqlite --output schema.sqlite3
+    """
+    from doctype_explorer.sqlite_export import write_schema_sqlite
+
+    frappe.init(site=get_site(context))
+    frappe.connect()
+    try:
+        output = output or frappe.get_site_path("private", "files", "doctype_docs", "schema.sqlite3")
+        counts = write_schema_sqlite(output)
+    finally:
+        frappe.destroy()
+
+    click.echo(f"Wrote {output}")
+    for table, count in counts.items():
+        click.echo(f"  {table}: {count} rows")
+
+
+commands = [export_doctype_docs, stream_doctype_docs, export_doctype_sqlite]
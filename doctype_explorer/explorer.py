@@ -1,11 +1,108 @@
 import os
-import json
+import sys
+from collections import deque
+from contextlib import nullcontext
 from datetime import datetime
 
 import frappe
 from frappe.model.meta import get_meta
 from werkzeug.wrappers import Response
 
+from .bulk import TABLE_FIELDTYPES
+from .cache import (
+    custom_perm_stamp,
+    get_cached_structure,
+    release_cached_structure,
+    set_cached_structure,
+)
+from .profiling import MemoryProfiler, nested_sizes, write_report
+from .publish import get_published_artifact, get_static_mode, static_response
+from .serializers import dump, dumps
+
+
+# Field attributes documented for DocTypes reached through Link and Table fields
+LINKED_FIELD_KEYS = ("fieldname", "label", "fieldtype", "options", "required")
+CHILD_FIELD_KEYS = ("fieldname", "label", "fieldtype", "options", "required", "description")
+NESTED_LINK_FIELD_KEYS = ("fieldname", "label", "fieldtype", "options")
+
+
+def _walk_doctypes(
+    root_item,
+    root_doctype,
+    expand,
+    max_depth,
+    processed_doctypes,
+    start_depth=0,
+    on_revisit=None,
+):
+    """
+    Walk the DocType graph breadth-first with an explicit work queue, so deep
+    walks cannot hit the Python recursion limit.
+
+    Args:
+        root_item: Caller data for the root DocType, passed to ``expand``
+        root_doctype (str): Root DocType name
+        expand (callable): ``expand(item, doctype, depth)`` documents one DocType
+            and returns ``(child_item, child_doctype, child_depth)`` entries for
+            the DocTypes reached from it
+        max_depth (int | float): Entries at this depth or deeper are not expanded
+        processed_doctypes (set): DocTypes already expanded; updated in place
+        start_depth (int): Depth of the root DocType
+        on_revisit (callable | None): Called with the item of an entry whose
+            DocType was already expanded
+
+    Child tables are part of their parent document and are returned at the
+    parent's depth; such entries are walked before deeper ones.
+    """
+    queue = deque([(root_item, root_doctype, start_depth)])
+
+    while queue:
+        item, doctype, depth = queue.popleft()
+        if doctype in processed_doctypes:
+            if on_revisit:
+                on_revisit(item)
+            continue
+        processed_doctypes.add(doctype)
+
+        same_depth = []
+        for entry in expand(item, doctype, depth):
+            child_depth = entry[2]
+            if child_depth >= max_depth:
+                continue
+            if child_depth == depth:
+                same_depth.append(entry)
+            else:
+                queue.append(entry)
+        queue.extendleft(reversed(same_depth))
+
+
+def _field_summary(field, keys):
+    """Document a field of a nested DocType with the given attributes."""
+    summary = {}
+    for key in keys:
+        if key == "required":
+            summary[key] = bool(field.reqd)
+        elif key == "description":
+            summary[key] = field.description or ""
+        else:
+            summary[key] = getattr(field, key)
+    return summary
+
+
+def _nested_structure(doctype, field, field_keys):
+    """Document a DocType reached through a Link or Table field."""
+    try:
+        nested_meta = get_meta(doctype)
+    except Exception as e:  # noqa: BLE001
+        return {"error": str(e), "doctype_name": doctype}
+
+    return {
+        "doctype_name": doctype,
+        "field_reference": field.fieldname,
+        "label": field.label,
+        "fields": [_field_summary(f, field_keys) for f in nested_meta.fields],
+    }
+
 
 def generate_doctype_json(
     doctype_name,
@@ -14,22 +111,49 @@ def generate_doctype_json(
     include_nested_links=True,
     max_depth=3,
     current_depth=0,
+    profile=False,
 ):
     """
     Generate comprehensive JSON documentation for a DocType including all linked
     DocTypes and child tables.
 
+    Linked DocTypes are documented one level deeper than the DocType linking to
+    them, down to ``max_depth``; DocTypes up to ``max_depth - 1`` are expanded
+    further. Child tables (Table and Table MultiSelect) belong to their parent
+    and are documented at its level, including their nested links and child
+    tables. Each DocType is expanded once; later occurrences list their fields
+    and are flagged with ``_circular_reference``.
+
     Args:
         doctype_name (str): Name of the DocType to document
         output_path (str | bool | None): Path to save JSON. If False, do not save.
         processed_doctypes (set | None): Track already processed doctypes
-        include_nested_links (bool): Whether to include nested link documentation
+        include_nested_links (bool): Whether to expand linked DocTypes beyond the
+            first level
         max_depth (int): Maximum recursion depth for nested links
         current_depth (int): Current recursion depth
+        profile (bool): Trace memory while generating and add the report to the
+            returned structure under ``memory_profile`` (not saved to the file)
 
     Returns:
         dict: Complete DocType structure as dictionary
     """
+    if profile:
+        with MemoryProfiler() as profiler:
+            structure = generate_doctype_json(
+                doctype_name,
+                output_path=output_path,
+                processed_doctypes=processed_doctypes,
+                include_nested_links=include_nested_links,
+                max_depth=max_depth,
+                current_depth=current_depth,
+            )
+            profiler.mark_peak(doctype_name)
+        # Sized after tracing so the profiler's own serialization is not counted
+        profiler.set_output(len(dumps(structure).encode("utf-8")), nested=nested_sizes(structure))
+        structure["memory_profile"] = profiler.report()
+        return structure
+
     if processed_doctypes is None:
         processed_doctypes = set()
 
@@ -41,8 +165,6 @@ def generate_doctype_json(
             "depth_exceeded": current_depth >= max_depth,
         }
 
-    processed_doctypes.add(doctype_name)
-
     # Get DocType metadata
     try:
         meta = get_meta(doctype_name)
@@ -81,9 +203,6 @@ def generate_doctype_json(
     }
 
     # Collect all fields
-    link_fields = []
-    child_table_fields = []
-
     for field in meta.fields:
         field_data = {
             "fieldname": field.fieldname,
@@ -109,123 +228,54 @@ def generate_doctype_json(
         # Update meta info counts
         if field.reqd:
             doctype_structure["meta_info"]["required_fields_count"] += 1
-
-        doctype_structure["fields"].append(field_data)
-
-        # Track Link and Table fields for detailed documentation
         if field.fieldtype == "Link" and field.options:
             doctype_structure["meta_info"]["link_fields_count"] += 1
-            link_fields.append(
-                {
-                    "field_name": field.fieldname,
-                    "label": field.label,
-                    "linked_doctype": field.options,
-                }
-            )
-        elif field.fieldtype == "Table" and field.options:
+        elif field.fieldtype in TABLE_FIELDTYPES and field.options:
             doctype_structure["meta_info"]["child_table_count"] += 1
-            child_table_fields.append(
-                {
-                    "field_name": field.fieldname,
-                    "label": field.label,
-                    "child_doctype": field.options,
-                }
-            )
-
-    # Document Link fields
-    for link in link_fields:
-        try:
-            linked_meta = get_meta(link["linked_doctype"])
-            linked_structure = {
-                "doctype_name": link["linked_doctype"],
-                "field_reference": link["field_name"],
-                "label": link["label"],
-                "fields": [],
-            }
 
-            for lf in linked_meta.fields:
-                linked_structure["fields"].append(
-                    {
-                        "fieldname": lf.fieldname,
-                        "label": lf.label,
-                        "fieldtype": lf.fieldtype,
-                        "options": lf.options,
-                        "required": bool(lf.reqd),
-                    }
-                )
-
-            doctype_structure["linked_doctypes"][link["field_name"]] = linked_structure
-        except Exception as e:  # noqa: BLE001
-            doctype_structure["linked_doctypes"][link["field_name"]] = {
-                "error": str(e),
-                "doctype_name": link["linked_doctype"],
-            }
-
-    # Document Child Table fields
-    for child in child_table_fields:
-        try:
-            child_meta = get_meta(child["child_doctype"])
-            child_structure = {
-                "doctype_name": child["child_doctype"],
-                "field_reference": child["field_name"],
-                "label": child["label"],
-                "fields": [],
-                "nested_links": {},
-            }
-
-            nested_links = []
-            for cf in child_meta.fields:
-                field_info = {
-                    "fieldname": cf.fieldname,
-                    "label": cf.label,
-                    "fieldtype": cf.fieldtype,
-                    "options": cf.options,
-                    "required": bool(cf.reqd),
-                    "description": cf.description or "",
-                }
-                child_structure["fields"].append(field_info)
-
-                # Track nested links
-                if cf.fieldtype == "Link" and cf.options:
-                    nested_links.append(
-                        {
-                            "fieldname": cf.fieldname,
-                            "label": cf.label,
-                            "linked_doctype": cf.options,
-                        }
-                    )
-
-            # Document nested links in child tables
-            for nl in nested_links:
-                try:
-                    nested_meta = get_meta(nl["linked_doctype"])
-                    nested_structure = {
-                        "doctype_name": nl["linked_doctype"],
-                        "field_reference": nl["fieldname"],
-                        "label": nl["label"],
-                        "fields": [],
-                    }
+        doctype_structure["fields"].append(field_data)
 
-                    for nf in nested_meta.fields:
-                        nested_structure["fields"].append(
-                            {
-                                "fieldname": nf.fieldname,
-                                "label": nf.label,
-                                "fieldtype": nf.fieldtype,
-                                "options": nf.options,
-                            }
-                        )
-
-                    child_structure["nested_links"][nl["fieldname"]] = nested_structure
-                except Exception as e:  # noqa: BLE001
-                    child_structure["nested_links"][nl["fieldname"]] = {"error": str(e)}
-
-            doctype_structure["child_tables"][child["field_name"]] = child_structure
-        except Exception as e:  # noqa: BLE001
-            doctype_structure["child_tables"][child["field_name"]] = {
-                "error": str(e),
-                "doctype_name": child["child_doctype"],
-            }
+    def expand(item, doctype, depth):
+        """Document the Link and Table fields of one DocType in the tree."""
+        structure, kind = item
+        entries = []
+        for field in meta.fields if kind == "root" else get_meta(doctype).fields:
+            if not field.options:
+                continue
+
+            if field.fieldtype == "Link":
+                # Links inside child tables keep their own key and field summary
+                if kind == "child":
+                    container = structure["nested_links"]
+                    nested = _nested_structure(field.options, field, NESTED_LINK_FIELD_KEYS)
+                else:
+                    container = structure.setdefault("linked_doctypes", {})
+                    nested = _nested_structure(field.options, field, LINKED_FIELD_KEYS)
+                container[field.fieldname] = nested
+                if "error" not in nested and include_nested_links:
+                    entries.append(((nested, "link"), field.options, depth + 1))
+
+            elif field.fieldtype in TABLE_FIELDTYPES:
+                nested = _nested_structure(field.options, field, CHILD_FIELD_KEYS)
+                structure.setdefault("child_tables", {})[field.fieldname] = nested
+                if "error" not in nested:
+                    nested["nested_links"] = {}
+                    entries.append(((nested, "child"), field.options, depth))
+
+        return entries
+
+    def on_revisit(item):
+        item[0]["_circular_reference"] = True
+
+    _walk_doctypes(
+        (doctype_structure, "root"),
+        doctype_name,
+        expand,
+        max_depth,
+        processed_doctypes,
+        start_depth=current_depth,
+        on_revisit=on_revisit,
+    )
 
     # Add permissions info
     if getattr(meta, "permissions", None):
@@ -252,13 +302,37 @@ def generate_doctype_json(
             output_path = os.path.join(output_dir, f"{doctype_name.replace(' ', '_')}.json")
 
         with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(doctype_structure, f, indent=2, ensure_ascii=False)
+            dump(doctype_structure, f, pretty=True)
 
         frappe.msgprint(f"Documentation generated successfully at: {output_path}")
 
     return doctype_structure
 
 
+def get_doctype_structure(doctype_name, level=0):
+    """
+    Return the DocType structure for a depth level, served from the site cache
+    when available. Cached entries are dropped whenever DocType meta changes and
+    ignored once Custom DocPerm rows change.
+
+    Args:
+        doctype_name (str): Name of the DocType to document
+        level (int): Maximum recursion depth for nested links (0 for infinite)
+
+    Returns:
+        dict: Complete DocType structure as dictionary
+    """
+    level = int(level or 0)
+    # Taken before generating so a concurrent permission change is not masked
+    stamp = custom_perm_stamp()
+    structure = get_cached_structure(doctype_name, level, stamp)
+    if structure is None:
+        max_depth = level if level > 0 else float('inf')
+        structure = generate_doctype_json(doctype_name, output_path=False, max_depth=max_depth)
+        set_cached_structure(doctype_name, level, structure, stamp)
+    return structure
+
+
 @frappe.whitelist()
 def generate_doctype_documentation(doctype_name, return_json=False, level=0):
     """
@@ -278,7 +352,7 @@ def generate_doctype_documentation(doctype_name, return_json=False, level=0):
         max_depth = level if level > 0 else float('inf')
 
         if frappe.utils.cstr(return_json).lower() in {"true", "1"}:
-            structure = generate_doctype_json(doctype_name, output_path=False, max_depth=max_depth)
+            structure = get_doctype_structure(doctype_name, level)
             return {
                 "success": True,
                 "data": structure,
@@ -311,7 +385,7 @@ def document_doctype(doctype_name):
     Then: document_doctype("Sales Order")
     """
     result = generate_doctype_json(doctype_name)
-    print(json.dumps(result, indent=2))
+    print(dumps(result, pretty=True))
     return result
 
 
@@ -323,19 +397,91 @@ def execute_from_bench(doctype_name):
     return generate_doctype_json(doctype_name)
 
 
+def stream_doctype_documentation(
+    doctypes=None, module=None, level=1, output=None, buffer_size=64 * 1024
+):
+    """
+    Write one compact JSON record per DocType (newline-delimited JSON) as each
+    structure is generated, so site-wide dumps never hold more than one
+    structure in memory.
+    Usage: bench --site [sitename] stream-doctype-docs --module Selling | jq .doctype_name
+
+    Args:
+        doctypes (list | None): DocType names (if None, uses module filter or all DocTypes)
+        module (str | list | None): Only stream DocTypes of these modules
+        level (int): Maximum recursion depth for nested links (0 for infinite)
+        output (str | None): File path to write to; None or "-" for stdout
+        buffer_size (int): Write buffer size in bytes
+
+    Returns:
+        int: Number of records written
+    """
+    if not doctypes:
+        filters = {}
+        if module:
+            filters["module"] = ["in", [module] if isinstance(module, str) else list(module)]
+        doctypes = frappe.get_all("DocType", filters=filters, pluck="name", order_by="name asc")
+
+    level = int(level or 0)
+    max_depth = level if level > 0 else float('inf')
+
+    if output in (None, "-"):
+        stream = open(sys.stdout.fileno(), "wb", buffering=buffer_size, closefd=False)
+    else:
+        stream = open(output, "wb", buffering=buffer_size)
+
+    stamp = custom_perm_stamp()
+    written = 0
+    try:
+        for dt in doctypes:
+            try:
+                structure = get_cached_structure(dt, level, stamp) or generate_doctype_json(
+                    dt, output_path=False, max_depth=max_depth
+                )
+            except Exception as e:  # noqa: BLE001
+                structure = {"doctype_name": dt, "error": str(e)}
+            finally:
+                # Otherwise every cache hit stays in memory until the command exits
+                release_cached_structure(dt, level)
+
+            # Blocks while the reader is behind, so memory stays flat
+            stream.write(dumps(structure).encode("utf-8") + b"\n")
+            written += 1
+        stream.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. `| head`); stop quietly
+        pass
+    finally:
+        try:
+            stream.close()
+        except BrokenPipeError:
+            pass
+
+    return written
+
+
 @frappe.whitelist()
-def bulk_generate_documentation(doctypes=None, module=None):
+def bulk_generate_documentation(doctypes=None, module=None, level=1, profile=False):
     """
     Generate documentation for multiple DocTypes at once.
 
     Args:
         doctypes (list | None): List of DocType names (if None, uses module filter)
         module (str | None): Generate for all DocTypes in a module
+        level (int): Maximum recursion depth for nested links (default: 1, 0 for
+            infinite, which walks the whole transitive Link closure of every
+            DocType)
+        profile (bool): Trace memory per DocType (System Manager only). The
+            report is returned under ``memory_profile`` and saved to the site's
+            private files.
 
     Returns:
         dict: Results for all DocTypes
     """
     results = []
+    profile = frappe.utils.cstr(profile).lower() in {"true", "1"}
+    if profile:
+        frappe.only_for("System Manager")
 
     if module:
         # Get all DocTypes in module
@@ -344,25 +490,38 @@ def bulk_generate_documentation(doctypes=None, module=None):
     if not doctypes:
         return {"success": False, "message": "No DocTypes specified"}
 
-    for dt in doctypes:
-        try:
-            result = generate_doctype_documentation(dt)
-            results.append(
-                {
-                    "doctype": dt,
-                    "success": result["success"],
-                    "file_path": result.get("file_path", ""),
-                }
-            )
-        except Exception as e:  # noqa: BLE001
-            results.append({"doctype": dt, "success": False, "error": str(e)})
+    with MemoryProfiler() if profile else nullcontext() as profiler:
+        for dt in doctypes:
+            if profiler:
+                profiler.start_doctype()
+            try:
+                result = generate_doctype_documentation(dt, level=level)
+                results.append(
+                    {
+                        "doctype": dt,
+                        "success": result["success"],
+                        "file_path": result.get("file_path", ""),
+                    }
+                )
+            except Exception as e:  # noqa: BLE001
+                results.append({"doctype": dt, "success": False, "error": str(e)})
+            if profiler:
+                profiler.mark_peak(dt)
+                file_path = results[-1].get("file_path")
+                profiler.set_output(
+                    os.path.getsize(file_path) if file_path and os.path.exists(file_path) else 0
+                )
 
-    return {
+    response = {
         "success": True,
         "results": results,
         "total": len(doctypes),
         "successful": len([r for r in results if r["success"]]),
     }
+    if profiler:
+        response["memory_profile"] = profiler.report()
+        response["memory_profile_path"] = write_report(response["memory_profile"])
+    return response
 
 
 @frappe.whitelist()
@@ -378,8 +537,13 @@ def compare_doctypes(doctype1, doctype2):
         dict: Comparison results
     """
     try:
-        dt1_data = generate_doctype_json(doctype1, output_path=False)
-        dt2_data = generate_doctype_json(doctype2, output_path=False)
+        # Only top-level fields are compared, so skip the nested walk
+        dt1_data = generate_doctype_json(
+            doctype1, output_path=False, include_nested_links=False, max_depth=1
+        )
+        dt2_data = generate_doctype_json(
+            doctype2, output_path=False, include_nested_links=False, max_depth=1
+        )
 
         # Compare fields
         fields1 = {f["fieldname"]: f for f in dt1_data["fields"]}
@@ -425,24 +589,37 @@ def get_doctype_dependencies(doctype_name, depth=1):
         depth (int): How many levels deep to search
 
     Returns:
-        dict: Dependency tree
+        dict: Dependency tree. With ``depth`` > 1, linked DocTypes and child
+        tables are listed under ``nested_dependencies``; a DocType already
+        expanded elsewhere in the tree is flagged with ``_circular_reference``.
     """
-    try:
-        meta = get_meta(doctype_name)
-        dependencies = {
-            "doctype": doctype_name,
+
+    def new_dependencies(doctype):
+        return {
+            "doctype": doctype,
             "direct_links": [],
             "child_tables": [],
             "total_dependencies": 0,
         }
 
+    def expand(item, doctype, current_depth):
+        result, dependencies = item
+        try:
+            meta = get_meta(doctype)
+        except Exception as e:  # noqa: BLE001
+            if result is root:
+                raise
+            result.update({"success": False, "message": str(e)})
+            del result["dependencies"]
+            return []
+
         # Get direct links
         for field in meta.fields:
             if field.fieldtype == "Link" and field.options:
                 dependencies["direct_links"].append(
                     {"field": field.fieldname, "linked_to": field.options}
                 )
-            elif field.fieldtype == "Table" and field.options:
+            elif field.fieldtype in TABLE_FIELDTYPES and field.options:
                 dependencies["child_tables"].append(
                     {"field": field.fieldname, "child_doctype": field.options}
                 )
@@ -451,16 +628,38 @@ def get_doctype_dependencies(doctype_name, depth=1):
             dependencies["child_tables"]
         )
 
-        # Recursive dependencies if depth > 1
-        if int(depth) > 1:
-            nested_deps = {}
-            for link in dependencies["direct_links"]:
-                nested_deps[link["linked_to"]] = get_doctype_dependencies(
-                    link["linked_to"], int(depth) - 1
-                )
-            dependencies["nested_dependencies"] = nested_deps
+        # Nested dependencies if depth allows
+        if current_depth + 1 >= max_depth:
+            return []
+
+        nested_deps = dependencies.setdefault("nested_dependencies", {})
+        entries = []
+        targets = [link["linked_to"] for link in dependencies["direct_links"]] + [
+            child["child_doctype"] for child in dependencies["child_tables"]
+        ]
+        for target in targets:
+            if target in nested_deps:
+                continue
+            nested = {"success": True, "dependencies": new_dependencies(target)}
+            nested_deps[target] = nested
+            entries.append(((nested, nested["dependencies"]), target, current_depth + 1))
+        return entries
+
+    def on_revisit(item):
+        item[1]["_circular_reference"] = True
 
-        return {"success": True, "dependencies": dependencies}
+    try:
+        max_depth = int(depth)
+        root = {"success": True, "dependencies": new_dependencies(doctype_name)}
+        _walk_doctypes(
+            (root, root["dependencies"]),
+            doctype_name,
+            expand,
+            max_depth,
+            set(),
+            on_revisit=on_revisit,
+        )
+        return root
     except Exception as e:  # noqa: BLE001
         return {"success": False, "message": str(e)}
 
@@ -476,7 +675,10 @@ def export_to_html(doctype_name):
     Returns:
         str: Path to HTML file
     """
-    data = generate_doctype_json(doctype_name, output_path=False)
+    # Only top-level fields are rendered, so skip the nested walk
+    data = generate_doctype_json(
+        doctype_name, output_path=False, include_nested_links=False, max_depth=1
+    )
 
     html = f"""
     <!DOCTYPE html>
@@ -557,6 +759,21 @@ def export_to_html(doctype_name):
     return output_path
 
 
+def get_auth_key():
+    """
+    Return the configured AUTH-KEY for get_doctype_api.
+    Priority: Environment variable > Site config > System Settings custom field
+
+    Returns:
+        str | None: Configured key
+    """
+    return (
+        os.environ.get('DOCTYPE_EXPLORER_AUTH_KEY') or
+        frappe.conf.get('doctype_explorer_auth_key') or
+        frappe.db.get_value('System Settings', 'System Settings', 'custom_doctype_explorer_auth_key')
+    )
+
+
 @frappe.whitelist(allow_guest=True)
 def get_doctype_api():
     """
@@ -567,12 +784,15 @@ def get_doctype_api():
         AUTH-KEY (str, required): Authentication key
         doctype_name (str, required): Name of the DocType to document
         level (int, optional): Maximum recursion depth (0 for infinite, default: 0)
+        pretty (int, optional): 0 for compact JSON (default: 1, indented)
     
     Headers (alternative):
         AUTH-KEY: Can be passed in headers instead of GET parameters
     
     Returns:
-        dict: JSON response with DocType structure or error message
+        dict: JSON response with DocType structure or error message. With
+        ``doctype_explorer_static_mode`` set, published DocTypes are answered
+        with a redirect to their precompressed artifact instead (see publish.py).
     
     Example:
         GET /api/method/doctype_explorer.explorer.get_doctype_api?AUTH-KEY=your_key&doctype_name=Sales Order&level=2
@@ -587,12 +807,7 @@ def get_doctype_api():
         )
     
     # Validate AUTH-KEY
-    # Priority: Environment variable > Site config > System Settings custom field
-    valid_auth_key = (
-        os.environ.get('DOCTYPE_EXPLORER_AUTH_KEY') or
-        frappe.conf.get('doctype_explorer_auth_key') or
-        frappe.db.get_value('System Settings', 'System Settings', 'custom_doctype_explorer_auth_key')
-    )
+    valid_auth_key = get_auth_key()
     
     # If no auth key is configured, throw error
     if not valid_auth_key:
@@ -616,15 +831,20 @@ def get_doctype_api():
         level = int(level) if level else 0
     except (ValueError, TypeError):
         level = 0
+    pretty = frappe.utils.cstr(frappe.form_dict.get('pretty', 1)).lower() not in {'0', 'false'}
+    
+    # Let nginx serve published DocTypes (always compact JSON)
+    static_mode = get_static_mode()
+    if static_mode:
+        artifact = get_published_artifact(
+            doctype_name, level, valid_auth_key, static_mode, custom_perm_stamp()
+        )
+        if artifact:
+            return static_response(artifact, static_mode)
     
     # Generate documentation
     try:
-        max_depth = level if level > 0 else float('inf')
-        structure = generate_doctype_json(
-            doctype_name,
-            output_path=False,
-            max_depth=max_depth
-        )
+        structure = get_doctype_structure(doctype_name, level)
         
         response_data = {
             'success': True,
@@ -635,7 +855,7 @@ def get_doctype_api():
         }
         
         # Return formatted JSON response
-        formatted_json = json.dumps(response_data, indent=2, ensure_ascii=False, default=str)
+        formatted_json = dumps(response_data, pretty=pretty)
         response = Response(
             formatted_json,
             mimetype='application/json',
@@ -655,7 +875,7 @@ def get_doctype_api():
         }
         
         # Return formatted JSON response for errors too
-        formatted_json = json.dumps(error_data, indent=2, ensure_ascii=False, default=str)
+        formatted_json = dumps(error_data, pretty=pretty)
         response = Response(
             formatted_json,
             mimetype='application/json',
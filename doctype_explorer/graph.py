@@ -0,0 +1,385 @@
+"""Site-wide Link/Table graph of DocTypes and its export formats.
+
+Edges follow the same rules as ``get_doctype_dependencies``: a Link field
+points at the DocType in its options, a Table (or Table MultiSelect) field at
+its child DocType. The adjacency index is built from bulk field data and cached
+until the schema changes.
+"""
+
+import json
+import os
+import sys
+import zipfile
+from array import array
+from xml.sax.saxutils import escape, quoteattr
+
+import frappe
+
+from .bulk import LINK_FIELDTYPES, get_doctypes, load_fields
+from .cache import LINK_GRAPH_CACHE_KEY
+
+# Export format -> file extension
+GRAPH_EXPORT_FORMATS = {"dot": "dot", "graphml": "graphml", "csr": "csr.zip"}
+
+
+def build_link_graph():
+    """
+    Build the adjacency index for every DocType from bulk field data.
+
+    Returns:
+        dict: ``outgoing`` and ``incoming`` maps of DocType name to a list of
+        (other_doctype, fieldname, fieldtype) edges. For outgoing edges the field
+        belongs to the key, for incoming edges it belongs to ``other_doctype``.
+    """
+    outgoing = {}
+    incoming = {}
+
+    for doctype, fields in load_fields(fieldtypes=LINK_FIELDTYPES).items():
+        for field in fields:
+            target = field["options"]
+            if not target:
+                continue
+            outgoing.setdefault(doctype, []).append((target, field["fieldname"], field["fieldtype"]))
+            incoming.setdefault(target, []).append((doctype, field["fieldname"], field["fieldtype"]))
+
+    return {"outgoing": outgoing, "incoming": incoming}
+
+
+def get_link_graph():
+    """
+    Return the cached adjacency index, building it on first use.
+
+    Returns:
+        dict: See ``build_link_graph``
+    """
+    return frappe.cache().get_value(LINK_GRAPH_CACHE_KEY, generator=build_link_graph)
+
+
+def _hop(from_doctype, to_doctype, fieldname, fieldtype, reverse):
+    return {
+        "from_doctype": from_doctype,
+        "to_doctype": to_doctype,
+        "fieldname": fieldname,
+        "fieldtype": fieldtype,
+        # The DocType that owns the field used for the join
+        "field_on": to_doctype if reverse else from_doctype,
+        "direction": "reverse" if reverse else "forward",
+    }
+
+
+def _successors(graph, doctype, directed):
+    """Yield (next_doctype, hop) moves away from doctype along the path direction."""
+    for target, fieldname, fieldtype in graph["outgoing"].get(doctype, ()):
+        yield target, _hop(doctype, target, fieldname, fieldtype, reverse=False)
+    if not directed:
+        for source, fieldname, fieldtype in graph["incoming"].get(doctype, ()):
+            yield source, _hop(doctype, source, fieldname, fieldtype, reverse=True)
+
+
+def _predecessors(graph, doctype, directed):
+    """Yield (previous_doctype, hop) moves that lead into doctype along the path direction."""
+    for source, fieldname, fieldtype in graph["incoming"].get(doctype, ()):
+        yield source, _hop(source, doctype, fieldname, fieldtype, reverse=False)
+    if not directed:
+        for target, fieldname, fieldtype in graph["outgoing"].get(doctype, ()):
+            yield target, _hop(target, doctype, fieldname, fieldtype, reverse=True)
+
+
+def shortest_link_path(graph, from_doctype, to_doctype, directed=False, max_hops=6):
+    """
+    Find the shortest chain of fields joining two DocTypes with a bidirectional
+    breadth-first search.
+
+    Args:
+        graph (dict): Adjacency index from ``get_link_graph``
+        from_doctype (str): Start DocType
+        to_doctype (str): Target DocType
+        directed (bool): Only follow fields from the owning DocType to its target
+        max_hops (int): Longest path to look for
+
+    Returns:
+        list | None: Hops from start to target, or None if no path exists
+    """
+    if from_doctype == to_doctype:
+        return []
+
+    # doctype -> (neighbour closer to the search origin, hop between them)
+    forward_parents = {from_doctype: None}
+    backward_parents = {to_doctype: None}
+    forward_frontier = [from_doctype]
+    backward_frontier = [to_doctype]
+    hops = 0
+
+    while forward_frontier and backward_frontier and hops < max_hops:
+        hops += 1
+        # Expand the smaller frontier by one full level
+        expand_forward = len(forward_frontier) <= len(backward_frontier)
+        frontier = forward_frontier if expand_forward else backward_frontier
+        parents = forward_parents if expand_forward else backward_parents
+        others = backward_parents if expand_forward else forward_parents
+        moves = _successors if expand_forward else _predecessors
+
+        next_frontier = []
+        meeting = None
+        for doctype in frontier:
+            for neighbour, hop in moves(graph, doctype, directed):
+                if neighbour in parents:
+                    continue
+                parents[neighbour] = (doctype, hop)
+                next_frontier.append(neighbour)
+                if neighbour in others:
+                    meeting = neighbour
+                    break
+            if meeting:
+                break
+
+        if meeting:
+            path = []
+            node = meeting
+            while forward_parents[node] is not None:
+                node, hop = forward_parents[node]
+                path.append(hop)
+            path.reverse()
+            node = meeting
+            while backward_parents[node] is not None:
+                node, hop = backward_parents[node]
+                path.append(hop)
+            return path
+
+        if expand_forward:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    return None
+
+
+@frappe.whitelist()
+def find_link_path(from_doctype, to_doctype, directed=False, max_hops=6):
+    """
+    Find how to join one DocType to another through Link and Table fields.
+
+    Args:
+        from_doctype (str): Start DocType (e.g. "Sales Invoice Item")
+        to_doctype (str): Target DocType (e.g. "Territory")
+        directed (bool): Only follow fields from the owning DocType to its target.
+            By default fields are also followed backwards, e.g. from a child
+            table to its parent.
+        max_hops (int): Longest path to look for
+
+    Returns:
+        dict: Field-level hops of the shortest path
+    """
+    try:
+        directed = frappe.utils.cstr(directed).lower() in {"true", "1"}
+        path = shortest_link_path(
+            get_link_graph(),
+            from_doctype,
+            to_doctype,
+            directed=directed,
+            max_hops=frappe.utils.cint(max_hops),
+        )
+
+        return {
+            "success": True,
+            "found": path is not None,
+            "from_doctype": from_doctype,
+            "to_doctype": to_doctype,
+            "hops": path or [],
+            "length": len(path) if path is not None else 0,
+        }
+    except Exception as e:  # noqa: BLE001
+        return {"success": False, "message": str(e)}
+
+
+def _iter_edges(fields_by_doctype):
+    """Yield (source, target, fieldname, fieldtype) for every Link/Table field."""
+    for doctype, fields in fields_by_doctype.items():
+        for field in fields:
+            if field["options"]:
+                yield doctype, field["options"], field["fieldname"], field["fieldtype"]
+
+
+def _dot_id(value):
+    return '"' + (value or "").replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _write_dot(f, doctypes, fields_by_doctype):
+    f.write("digraph schema {\n")
+    for dt in doctypes:
+        f.write(f"  {_dot_id(dt.name)} [module={_dot_id(dt.module)}, istable={int(dt.istable)}];\n")
+    # Link targets without a DocType record become implicit nodes
+    nodes = {dt.name for dt in doctypes}
+    edges = 0
+    for source, target, fieldname, fieldtype in _iter_edges(fields_by_doctype):
+        nodes.add(source)
+        nodes.add(target)
+        f.write(
+            f"  {_dot_id(source)} -> {_dot_id(target)} "
+            f"[label={_dot_id(fieldname)}, fieldtype={_dot_id(fieldtype)}];\n"
+        )
+        edges += 1
+    f.write("}\n")
+    return len(nodes), edges
+
+
+def _write_graphml(f, doctypes, fields_by_doctype):
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    f.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n')
+    f.write('  <key id="module" for="node" attr.name="module" attr.type="string"/>\n')
+    f.write('  <key id="istable" for="node" attr.name="istable" attr.type="boolean"/>\n')
+    f.write('  <key id="fieldname" for="edge" attr.name="fieldname" attr.type="string"/>\n')
+    f.write('  <key id="fieldtype" for="edge" attr.name="fieldtype" attr.type="string"/>\n')
+    f.write('  <graph id="schema" edgedefault="directed">\n')
+
+    known = set()
+    for dt in doctypes:
+        known.add(dt.name)
+        f.write(
+            f"    <node id={quoteattr(dt.name)}>"
+            f'<data key="module">{escape(dt.module or "")}</data>'
+            f'<data key="istable">{"true" if dt.istable else "false"}</data></node>\n'
+        )
+
+    # Link targets without a DocType record (e.g. broken links) still need a node
+    missing = set()
+    edges = 0
+    for source, target, fieldname, fieldtype in _iter_edges(fields_by_doctype):
+        if source not in known:
+            missing.add(source)
+        if target not in known:
+            missing.add(target)
+        f.write(
+            f"    <edge source={quoteattr(source)} target={quoteattr(target)}>"
+            f'<data key="fieldname">{escape(fieldname)}</data>'
+            f'<data key="fieldtype">{escape(fieldtype)}</data></edge>\n'
+        )
+        edges += 1
+    for name in sorted(missing):
+        f.write(f"    <node id={quoteattr(name)}/>\n")
+
+    f.write("  </graph>\n")
+    f.write("</graphml>\n")
+    return len(known) + len(missing), edges
+
+
+def _write_csr(path, doctypes, fields_by_doctype):
+    """
+    Write a zip archive with CSR adjacency arrays:
+
+        names.txt       one DocType name per line; line i is node i
+        indptr.i4       int32 little-endian, node count + 1 offsets into indices
+        indices.i4      int32 little-endian, target node of each edge
+        fieldtypes.u1   uint8 per edge, index into meta.json "fieldtypes"
+        fieldnames.txt  fieldname of each edge, one per line
+        meta.json       counts and array descriptions
+    """
+    names = [dt.name for dt in doctypes]
+    node_ids = {name: i for i, name in enumerate(names)}
+    fieldtype_ids = {fieldtype: i for i, fieldtype in enumerate(LINK_FIELDTYPES)}
+
+    indptr = array("i", [0])
+    indices = array("i")
+    fieldtypes = array("B")
+    fieldnames = []
+
+    for name in list(names):
+        for field in fields_by_doctype.get(name, ()):
+            target = field["options"]
+            if not target:
+                continue
+            if target not in node_ids:
+                # Link targets without a DocType record get nodes after all DocTypes
+                node_ids[target] = len(names)
+                names.append(target)
+            indices.append(node_ids[target])
+            fieldtypes.append(fieldtype_ids[field["fieldtype"]])
+            fieldnames.append(field["fieldname"])
+        indptr.append(len(indices))
+    indptr.extend([len(indices)] * (len(names) + 1 - len(indptr)))
+
+    if sys.byteorder == "big":
+        indptr.byteswap()
+        indices.byteswap()
+
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("names.txt", "\n".join(names))
+        zf.writestr("indptr.i4", indptr.tobytes())
+        zf.writestr("indices.i4", indices.tobytes())
+        zf.writestr("fieldtypes.u1", fieldtypes.tobytes())
+        zf.writestr("fieldnames.txt", "\n".join(fieldnames))
+        zf.writestr(
+            "meta.json",
+            json.dumps(
+                {
+                    "nodes": len(names),
+                    "edges": len(indices),
+                    "fieldtypes": list(LINK_FIELDTYPES),
+                    "arrays": {"indptr": "<i4", "indices": "<i4", "fieldtypes": "u1"},
+                },
+                indent=2,
+            ),
+        )
+
+    return len(names), len(indices)
+
+
+def write_graph(output_path, format="dot"):
+    """
+    Write the Link/Table graph of every DocType on the site to a file.
+
+    Args:
+        output_path (str): Path to write to
+        format (str): "dot", "graphml" or "csr" (zip archive of CSR index arrays
+            plus a name table)
+
+    Returns:
+        dict: Node and edge counts. Nodes include link targets without a
+        DocType record.
+    """
+    doctypes = get_doctypes()
+    fields_by_doctype = load_fields(fieldtypes=LINK_FIELDTYPES)
+
+    if format == "csr":
+        nodes, edges = _write_csr(output_path, doctypes, fields_by_doctype)
+    else:
+        writer = _write_dot if format == "dot" else _write_graphml
+        with open(output_path, "w", encoding="utf-8") as f:
+            nodes, edges = writer(f, doctypes, fields_by_doctype)
+
+    return {"nodes": nodes, "edges": edges}
+
+
+@frappe.whitelist()
+def export_graph(format="dot"):
+    """
+    Export the Link/Table graph of every DocType on the site in one pass to
+    public/files/doctype_docs/schema_graph.<ext>.
+
+    Args:
+        format (str): "dot", "graphml" or "csr" (zip archive of CSR index arrays
+            plus a name table)
+
+    Returns:
+        dict: File path plus node and edge counts
+    """
+    frappe.only_for("System Manager")
+    try:
+        format = (format or "dot").lower()
+        if format not in GRAPH_EXPORT_FORMATS:
+            frappe.throw(
+                f"Unsupported graph format '{format}'. Use one of: {', '.join(GRAPH_EXPORT_FORMATS)}"
+            )
+
+        output_dir = frappe.get_site_path("public", "files", "doctype_docs")
+        os.makedirs(output_dir, exist_ok=True)
+        output_path = os.path.join(output_dir, f"schema_graph.{GRAPH_EXPORT_FORMATS[format]}")
+
+        return {
+            "success": True,
+            "file_path": output_path,
+            "format": format,
+            **write_graph(output_path, format),
+        }
+    except Exception as e:  # noqa: BLE001
+        return {"success": False, "message": str(e)}
@@ -107,6 +107,11 @@ app_license = "mit"
 # before_app_uninstall = "doctype_explorer.utils.before_app_uninstall"
 # after_app_uninstall = "doctype_explorer.utils.after_app_uninstall"
 
+# Migration
+# ---------
+
+after_migrate = ["doctype_explorer.tasks.after_migrate"]
+
 # Desk Notifications
 # ------------------
 # See frappe.core.notifications.get_notification_config
@@ -145,9 +150,66 @@ app_license = "mit"
 # 	}
 # }
 
+# Any change to DocType meta invalidates the cached explorer structures and
+# updates the field search index
+doc_events = {
+	"DocType": {
+		"on_update": [
+			"doctype_explorer.cache.clear_schema_cache",
+			"doctype_explorer.search.update_field_index",
+			"doctype_explorer.tasks.republish_after_schema_change",
+		],
+		"on_trash": [
+			"doctype_explorer.cache.clear_schema_cache",
+			"doctype_explorer.tasks.republish_after_schema_change",
+		],
+		"after_delete": ["doctype_explorer.search.update_field_index"],
+	},
+	"Custom Field": {
+		"on_update": [
+			"doctype_explorer.cache.clear_schema_cache",
+			"doctype_explorer.search.update_field_index",
+			"doctype_explorer.tasks.republish_after_schema_change",
+		],
+		"on_trash": [
+			"doctype_explorer.cache.clear_schema_cache",
+			"doctype_explorer.tasks.republish_after_schema_change",
+		],
+		"after_delete": ["doctype_explorer.search.update_field_index"],
+	},
+	"Property Setter": {
+		"on_update": [
+			"doctype_explorer.cache.clear_schema_cache",
+			"doctype_explorer.search.update_field_index",
+			"doctype_explorer.tasks.republish_after_schema_change",
+		],
+		"on_trash": [
+			"doctype_explorer.cache.clear_schema_cache",
+			"doctype_explorer.tasks.republish_after_schema_change",
+		],
+		"after_delete": ["doctype_explorer.search.update_field_index"],
+	},
+	"Custom DocPerm": {
+		"on_update": [
+			"doctype_explorer.cache.clear_schema_cache",
+			"doctype_explorer.tasks.republish_after_schema_change",
+		],
+		"on_trash": [
+			"doctype_explorer.cache.clear_schema_cache",
+			"doctype_explorer.tasks.republish_after_schema_change",
+		],
+	},
+}
+
 # Scheduled Tasks
 # ---------------
 
+scheduler_events = {
+	"hourly_long": [
+		"doctype_explorer.tasks.warm_structure_cache",
+	],
+}
+
 # scheduler_events = {
 # 	"all": [
 # 		"doctype_explorer.tasks.all"
@@ -0,0 +1,344 @@
+"""Parallel documentation export for many sites on one bench.
+
+The export runs in three steps:
+
+1. Every site is fingerprinted in a worker process. Each DocType gets a hash
+   of its own schema (DocType properties, fields, Property Setters and
+   permissions) combined with the schemas of every DocType its documentation
+   includes at the requested level.
+2. Each distinct hash is generated once, on one of the sites that has it.
+   Work is spread across sites so every worker opens one connection.
+3. Every other site with the same hash gets a copy of that file.
+
+Unmodified core DocTypes therefore get documented once per bench instead of
+once per site.
+"""
+
+import hashlib
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import frappe
+
+from .bulk import FIELD_COLUMNS, LINK_FIELDTYPES, TABLE_FIELDTYPES, load_fields
+from .cache import release_cached_structure
+from .explorer import _walk_doctypes, get_doctype_structure
+from .serializers import dump, dumps
+
+# DocType properties that appear in the generated structure
+DOCTYPE_PROPERTIES = (
+    "name",
+    "module",
+    "is_submittable",
+    "istable",
+    "track_changes",
+    "allow_rename",
+    "allow_import",
+    "is_tree",
+    "editable_grid",
+    "quick_entry",
+    "title_field",
+    "image_field",
+    "description",
+    "autoname",
+    "sort_field",
+    "sort_order",
+)
+
+# Field columns that appear in the generated structure
+FINGERPRINT_FIELD_COLUMNS = FIELD_COLUMNS + (
+    "read_only",
+    "in_list_view",
+    "in_standard_filter",
+    "in_global_search",
+    "bold",
+    "hidden",
+    "print_hide",
+    "`default`",
+    "length",
+    "`precision`",
+    "depends_on",
+)
+
+PERMISSION_COLUMNS = (
+    "parent",
+    "role",
+    "permlevel",
+    "`read`",
+    "`write`",
+    "`create`",
+    "`delete`",
+    "`submit`",
+    "`cancel`",
+    "`amend`",
+)
+
+
+def _connect(site, sites_path):
+    frappe.init(site=site, sites_path=sites_path)
+    frappe.connect()
+
+
+def get_output_path(site, doctype_name, sites_path="."):
+    """Path of a DocType's JSON documentation in a site's public files."""
+    return os.path.join(
+        sites_path,
+        site,
+        "public",
+        "files",
+        "doctype_docs",
+        f"{doctype_name.replace(' ', '_')}.json",
+    )
+
+
+def _own_hashes():
+    """Hash the schema of every DocType on the connected site."""
+    rows = {}
+
+    for dt in frappe.get_all("DocType", fields=list(DOCTYPE_PROPERTIES), order_by="name asc"):
+        rows[dt.name] = {
+            "doctype": dt,
+            "fields": [],
+            "custom_field_positions": [],
+            "property_setters": [],
+            "permissions": [],
+        }
+
+    for doctype, fields in load_fields(columns=FINGERPRINT_FIELD_COLUMNS).items():
+        if doctype in rows:
+            rows[doctype]["fields"] = fields
+
+    # get_meta orders custom fields by insert_after, which DocField lacks
+    for cf in frappe.get_all(
+        "Custom Field",
+        fields=["dt", "fieldname", "insert_after"],
+        order_by="dt asc, fieldname asc",
+    ):
+        if cf.dt in rows:
+            rows[cf.dt]["custom_field_positions"].append((cf.fieldname, cf.insert_after))
+
+    # All Property Setters count, including DocType-level ones and properties
+    # that load_fields does not apply
+    for ps in frappe.get_all(
+        "Property Setter",
+        fields=["doc_type", "doctype_or_field", "field_name", "property", "value"],
+        order_by="doc_type asc, field_name asc, property asc",
+    ):
+        if ps.doc_type in rows:
+            rows[ps.doc_type]["property_setters"].append(ps)
+
+    # Custom DocPerm replaces DocPerm for a DocType, as in get_meta
+    standard_perms = {}
+    for row in frappe.get_all(
+        "DocPerm",
+        filters={"parenttype": "DocType"},
+        fields=list(PERMISSION_COLUMNS),
+        order_by="parent asc, idx asc",
+    ):
+        standard_perms.setdefault(row.parent, []).append(row)
+    custom_perms = {}
+    for row in frappe.get_all(
+        "Custom DocPerm", fields=list(PERMISSION_COLUMNS), order_by="parent asc, idx asc"
+    ):
+        custom_perms.setdefault(row.parent, []).append(row)
+    for doctype, perms in {**standard_perms, **custom_perms}.items():
+        if doctype in rows:
+            rows[doctype]["permissions"] = perms
+
+    return {
+        doctype: hashlib.sha1(dumps(data).encode("utf-8")).hexdigest()
+        for doctype, data in rows.items()
+    }
+
+
+def _documented_doctypes(doctype, outgoing, level):
+    """
+    DocTypes whose schema appears in the documentation of ``doctype``. Uses the
+    same traversal as generate_doctype_json, so child tables reached at a
+    shallower depth are expanded first exactly as they are there.
+    """
+    max_depth = level if level > 0 else float("inf")
+    documented = {doctype}
+
+    def expand(item, current, depth):
+        entries = []
+        for target, fieldtype in outgoing.get(current, ()):
+            documented.add(target)
+            child_depth = depth if fieldtype in TABLE_FIELDTYPES else depth + 1
+            entries.append((None, target, child_depth))
+        return entries
+
+    _walk_doctypes(None, doctype, expand, max_depth, set())
+    return documented
+
+
+def fingerprint_site(site, sites_path, modules=None, level=1):
+    """
+    Worker: hash every DocType (optionally only some modules) on one site.
+
+    Args:
+        site (str): Site name
+        sites_path (str): Bench sites directory
+        modules (list | None): Only fingerprint DocTypes of these modules
+        level (int): Documentation depth (0 for infinite)
+
+    Returns:
+        dict: DocType name -> fingerprint
+    """
+    _connect(site, sites_path)
+    try:
+        own = _own_hashes()
+
+        outgoing = {}
+        for doctype, fields in load_fields(fieldtypes=LINK_FIELDTYPES).items():
+            outgoing[doctype] = [(f["options"], f["fieldtype"]) for f in fields if f["options"]]
+
+        filters = {"module": ["in", list(modules)]} if modules else {}
+        targets = frappe.get_all("DocType", filters=filters, pluck="name", order_by="name asc")
+
+        fingerprints = {}
+        for doctype in targets:
+            members = sorted(_documented_doctypes(doctype, outgoing, level))
+            combined = "\n".join(f"{name}:{own.get(name, '')}" for name in members)
+            fingerprints[doctype] = hashlib.sha1(
+                f"{level}\n{doctype}\n{combined}".encode("utf-8")
+            ).hexdigest()
+        return fingerprints
+    finally:
+        frappe.destroy()
+
+
+def generate_site(site, sites_path, doctypes, level=1):
+    """
+    Worker: generate and save documentation for DocTypes on one site.
+
+    Args:
+        site (str): Site name
+        sites_path (str): Bench sites directory
+        doctypes (list): DocType names
+        level (int): Documentation depth (0 for infinite)
+
+    Returns:
+        dict: DocType name -> error message, for DocTypes that failed
+    """
+    _connect(site, sites_path)
+    errors = {}
+    try:
+        for doctype in doctypes:
+            try:
+                structure = get_doctype_structure(doctype, level)
+                output_path = get_output_path(site, doctype, sites_path)
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                with open(output_path, "w", encoding="utf-8") as f:
+                    dump(structure, f, pretty=True)
+            except Exception as e:  # noqa: BLE001
+                errors[doctype] = str(e)
+            finally:
+                # Keep one structure in memory, not the whole site's
+                release_cached_structure(doctype, level)
+        return errors
+    finally:
+        frappe.destroy()
+
+
+def export_sites(sites, sites_path=".", modules=None, level=1, processes=None):
+    """
+    Export DocType documentation for many sites in parallel, generating each
+    distinct DocType schema only once.
+
+    Args:
+        sites (list): Site names
+        sites_path (str): Bench sites directory
+        modules (list | None): Only export DocTypes of these modules
+        level (int): Documentation depth (0 for infinite)
+        processes (int | None): Worker processes (default: CPU count)
+
+    Returns:
+        dict: Per-site counts of generated, shared and failed DocTypes, with
+        per-DocType errors. Sites that could not be fingerprinted report the
+        failure under ``error``; the other sites are still exported.
+    """
+    sites_path = os.path.abspath(sites_path)
+
+    # Spawned workers start without the parent's Frappe state
+    with ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn")) as pool:
+        fingerprint_jobs = {
+            site: pool.submit(fingerprint_site, site, sites_path, modules, level) for site in sites
+        }
+        # A site that cannot be fingerprinted is reported and left out
+        fingerprints = {}
+        site_errors = {}
+        for site, job in fingerprint_jobs.items():
+            try:
+                fingerprints[site] = job.result()
+            except Exception as e:  # noqa: BLE001
+                site_errors[site] = str(e)
+
+        # Assign each distinct schema to the site holding it with the least work
+        assigned = {site: [] for site in fingerprints}
+        source_of = {}
+        for site in fingerprints:
+            for doctype, fingerprint in fingerprints[site].items():
+                key = (doctype, fingerprint)
+                if key in source_of:
+                    continue
+                holders = [s for s in fingerprints if fingerprints[s].get(doctype) == fingerprint]
+                source = min(holders, key=lambda s: len(assigned[s]))
+                source_of[key] = source
+                assigned[source].append(doctype)
+
+        generate_jobs = {
+            site: pool.submit(generate_site, site, sites_path, doctypes, level)
+            for site, doctypes in assigned.items()
+            if doctypes
+        }
+        errors = {}
+        for site, job in generate_jobs.items():
+            try:
+                errors[site] = job.result()
+            except Exception as e:  # noqa: BLE001
+                # The worker died; every DocType it was generating failed
+                errors[site] = {doctype: str(e) for doctype in assigned[site]}
+
+    summary = {}
+    for site in sites:
+        if site in site_errors:
+            summary[site] = {
+                "total": 0,
+                "generated": 0,
+                "shared": 0,
+                "failed": 0,
+                "errors": {},
+                "error": site_errors[site],
+            }
+            continue
+
+        generated = shared = failed = 0
+        site_doctype_errors = {}
+        for doctype, fingerprint in fingerprints[site].items():
+            source = source_of[(doctype, fingerprint)]
+            if doctype in errors.get(source, {}):
+                failed += 1
+                site_doctype_errors[doctype] = errors[source][doctype]
+            elif source == site:
+                generated += 1
+            else:
+                try:
+                    target = get_output_path(site, doctype, sites_path)
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    shutil.copyfile(get_output_path(source, doctype, sites_path), target)
+                    shared += 1
+                except OSError as e:
+                    site_doctype_errors[doctype] = str(e)
+                    failed += 1
+        summary[site] = {
+            "total": len(fingerprints[site]),
+            "generated": generated,
+            "shared": shared,
+            "failed": failed,
+            "errors": site_doctype_errors,
+        }
+
+    return summary
@@ -0,0 +1,205 @@
+"""Role x DocType permission matrix loaded in bulk.
+
+DocPerm and Custom DocPerm rows for every DocType are read in two queries.
+As in Frappe, a DocType with Custom DocPerm rows uses those instead of its
+standard DocPerms.
+"""
+
+import csv
+import os
+
+import frappe
+
+from .bulk import get_doctypes
+from .cache import PERMISSION_MATRIX_CACHE_KEY, custom_perm_stamp
+
+# Bit i of a matrix cell is set when the role has PERMISSION_RIGHTS[i]
+PERMISSION_RIGHTS = (
+    "read",
+    "write",
+    "create",
+    "delete",
+    "submit",
+    "cancel",
+    "amend",
+    "report",
+    "export",
+    "import",
+    "share",
+    "print",
+    "email",
+    "select",
+)
+
+
+def _load_permissions(permlevel=None):
+    """
+    Return {doctype: [perm rows]} with Custom DocPerm replacing DocPerm, for
+    one permission level or (None) all of them.
+
+    As in ``Meta.set_custom_permissions``, a DocType with Custom DocPerm rows at
+    any level uses only those, so the level filter is applied after choosing
+    the row set.
+    """
+    fields = ["parent", "role", "permlevel", *(f"`{right}`" for right in PERMISSION_RIGHTS)]
+    filters = {"permlevel": permlevel} if permlevel is not None else {}
+
+    custom_perms = {}
+    for row in frappe.get_all("Custom DocPerm", fields=fields):
+        custom_perms.setdefault(row.parent, []).append(row)
+
+    perms = {}
+    for row in frappe.get_all(
+        "DocPerm", filters={**filters, "parenttype": "DocType"}, fields=fields
+    ):
+        if row.parent not in custom_perms:
+            perms.setdefault(row.parent, []).append(row)
+
+    for doctype, rows in custom_perms.items():
+        rows = [row for row in rows if permlevel is None or (row.permlevel or 0) == permlevel]
+        if rows:
+            perms[doctype] = rows
+
+    return perms
+
+
+def build_permission_matrix(permlevel=0):
+    """
+    Build the dense role x DocType matrix for one permission level.
+
+    Args:
+        permlevel (int): Permission level (0 for document-level permissions)
+
+    Returns:
+        dict: ``rights``, ``roles``, ``doctypes`` and ``modules`` (parallel to
+        ``doctypes``) plus ``matrix``, where ``matrix[r][d]`` is a bitmask of the
+        rights role ``r`` has on DocType ``d``
+    """
+    doctypes = [dt for dt in get_doctypes() if not dt.istable]
+    perms = _load_permissions(permlevel)
+
+    roles = sorted({row.role for rows in perms.values() for row in rows})
+    role_ids = {role: i for i, role in enumerate(roles)}
+    matrix = [[0] * len(doctypes) for _ in roles]
+
+    for doctype_id, dt in enumerate(doctypes):
+        for row in perms.get(dt.name, ()):
+            mask = 0
+            for bit, right in enumerate(PERMISSION_RIGHTS):
+                if row.get(right):
+                    mask |= 1 << bit
+            # Several rows for the same role (e.g. "if owner" variants) add up
+            matrix[role_ids[row.role]][doctype_id] |= mask
+
+    return {
+        "rights": list(PERMISSION_RIGHTS),
+        "roles": roles,
+        "doctypes": [dt.name for dt in doctypes],
+        "modules": [dt.module for dt in doctypes],
+        "matrix": matrix,
+    }
+
+
+def _as_list(value):
+    if not value:
+        return None
+    if isinstance(value, str):
+        return frappe.parse_json(value) if value.startswith("[") else [value]
+    return list(value)
+
+
+def _get_matrix(module=None, role=None, permlevel=0):
+    """Return the cached matrix filtered by module(s) and role(s)."""
+    permlevel = frappe.utils.cint(permlevel)
+    stamp = custom_perm_stamp()
+    data = frappe.cache().hget(PERMISSION_MATRIX_CACHE_KEY, str(permlevel))
+    if data is None or data.get("stamp") != stamp:
+        data = {**build_permission_matrix(permlevel), "stamp": stamp}
+        frappe.cache().hset(PERMISSION_MATRIX_CACHE_KEY, str(permlevel), data)
+
+    modules = _as_list(module)
+    roles = _as_list(role)
+
+    doctype_ids = [
+        i for i, dt_module in enumerate(data["modules"]) if not modules or dt_module in modules
+    ]
+    role_ids = [i for i, r in enumerate(data["roles"]) if not roles or r in roles]
+
+    return {
+        "rights": data["rights"],
+        "permlevel": permlevel,
+        "roles": [data["roles"][i] for i in role_ids],
+        "doctypes": [data["doctypes"][i] for i in doctype_ids],
+        "modules": [data["modules"][i] for i in doctype_ids],
+        "matrix": [[data["matrix"][r][d] for d in doctype_ids] for r in role_ids],
+    }
+
+
+@frappe.whitelist()
+def get_permission_matrix(module=None, role=None, permlevel=0):
+    """
+    Get the role x DocType x right permission matrix for the whole site.
+    Cached until DocType or Custom DocPerm records change.
+
+    Args:
+        module (str | list | None): Only include DocTypes of these modules
+        role (str | list | None): Only include these roles
+        permlevel (int): Permission level (default: 0)
+
+    Returns:
+        dict: Matrix where ``matrix[r][d]`` is a bitmask over ``rights``
+        (bit i set means the role has ``rights[i]``)
+    """
+    frappe.only_for("System Manager")
+    try:
+        return {"success": True, **_get_matrix(module, role, permlevel)}
+    except Exception as e:  # noqa: BLE001
+        return {"success": False, "message": str(e)}
+
+
+@frappe.whitelist()
+def export_permission_matrix(module=None, role=None, permlevel=0):
+    """
+    Export the permission matrix as CSV with one row per role and DocType that
+    has at least one right.
+
+    The file is written to the site's private files since it describes access
+    rights.
+
+    Args:
+        module (str | list | None): Only include DocTypes of these modules
+        role (str | list | None): Only include these roles
+        permlevel (int): Permission level (default: 0)
+
+    Returns:
+        dict: Path to CSV file and number of rows written
+    """
+    frappe.only_for("System Manager")
+    try:
+        data = _get_matrix(module, role, permlevel)
+
+        output_dir = frappe.get_site_path("private", "files", "doctype_docs")
+        os.makedirs(output_dir, exist_ok=True)
+        output_path = os.path.join(output_dir, "permission_matrix.csv")
+
+        rows = 0
+        with open(output_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["role", "doctype", "module", *data["rights"]])
+            for role_name, masks in zip(data["roles"], data["matrix"]):
+                for doctype, dt_module, mask in zip(data["doctypes"], data["modules"], masks):
+                    if not mask:
+                        continue
+                    writer.writerow(
+                        [
+                            role_name,
+                            doctype,
+                            dt_module,
+                            *((mask >> bit) & 1 for bit in range(len(data["rights"]))),
+                        ]
+                    )
+                    rows += 1
+
+        return {"success": True, "file_path": output_path, "rows": rows}
+    except Exception as e:  # noqa: BLE001
+        return {"success": False, "message": str(e)}
@@ -0,0 +1,227 @@
+"""Opt-in memory profiling for large explorer runs.
+
+Tracing every allocation slows generation down noticeably, so profiling only
+runs when a caller asks for it. Callers check their ``profile`` flag before
+touching this module; nothing is traced otherwise.
+"""
+
+import os
+import tracemalloc
+from datetime import datetime
+
+import frappe
+
+from .serializers import dump, dumps
+
+TOP_ALLOCATIONS = 15
+TOP_NESTED = 10
+
+# Structure keys holding nested DocTypes
+NESTED_SECTIONS = ("linked_doctypes", "child_tables", "nested_links")
+
+# Allocations made by the profiler itself are not reported
+_IGNORED_FILES = (tracemalloc.__file__, __file__, "<frozen importlib._bootstrap>")
+
+
+class MemoryProfiler:
+    """
+    Trace allocations while generating one or more DocTypes.
+
+    Use as a context manager. Call ``start_doctype`` before and ``mark_peak``
+    right after each DocType to get its own peak, then ``set_output`` with its
+    sizes. Sizes are best computed once the block has exited, when nothing is
+    traced any more; ``report`` summarises the run.
+    """
+
+    def __init__(self, top=TOP_ALLOCATIONS):
+        self.top = top
+        self.doctypes = []
+        self.top_allocations = []
+        self._started_tracing = False
+        self._baseline = None
+        self._base_memory = 0
+        self._doctype_memory = 0
+        self._current = 0
+        self._peak = 0
+        self._heaviest_peak = -1
+
+    def __enter__(self):
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._baseline = tracemalloc.take_snapshot().filter_traces(_ignore_filters())
+        tracemalloc.reset_peak()
+        self._base_memory = self._doctype_memory = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        current, peak = tracemalloc.get_traced_memory()
+        self._peak = max(self._peak, peak)
+        self._current = current
+        if self._heaviest_peak < 0:
+            self._capture_top_allocations()
+        if self._started_tracing:
+            tracemalloc.stop()
+        self._baseline = None
+        return False
+
+    def start_doctype(self):
+        """Start measuring the peak of the next DocType."""
+        self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self._doctype_memory = tracemalloc.get_traced_memory()[0]
+
+    def mark_peak(self, doctype):
+        """
+        Record the peak of the DocType generated since the last
+        ``start_doctype``. Call before anything else allocates.
+
+        Args:
+            doctype (str): DocType name
+        """
+        peak = tracemalloc.get_traced_memory()[1]
+        self._peak = max(self._peak, peak)
+        self.doctypes.append({"doctype": doctype, "peak_bytes": peak - self._doctype_memory})
+
+        # Keep allocation sites from the heaviest DocType while its data is live
+        if peak > self._heaviest_peak:
+            self._heaviest_peak = peak
+            self._capture_top_allocations()
+        # Later peak readings must not include the capture above
+        tracemalloc.reset_peak()
+
+    def set_output(self, output_bytes, nested=None):
+        """
+        Add sizes to the DocType recorded by the last ``mark_peak``.
+
+        Args:
+            output_bytes (int): Size of the serialized structure
+            nested (list | None): Largest nested DocTypes, from ``nested_sizes``
+        """
+        entry = self.doctypes[-1]
+        entry["output_bytes"] = output_bytes
+        if nested is not None:
+            entry["largest_nested"] = nested
+
+    def _capture_top_allocations(self):
+        # Only the summary is kept so held snapshots do not skew later peaks
+        snapshot = tracemalloc.take_snapshot().filter_traces(_ignore_filters())
+        stats = snapshot.compare_to(self._baseline, "lineno")
+        self.top_allocations = [
+            {
+                "file": stat.traceback[0].filename,
+                "line": stat.traceback[0].lineno,
+                "size_bytes": stat.size_diff,
+                "count": stat.count_diff,
+            }
+            for stat in stats[: self.top]
+            if stat.size_diff > 0
+        ]
+
+    def report(self):
+        """
+        Summarise the profiled run.
+
+        Returns:
+            dict: Peak and retained memory, top allocation sites and per-DocType
+            peaks and output sizes (largest peak first)
+        """
+        return {
+            "peak_bytes": self._peak - self._base_memory,
+            "retained_bytes": self._current - self._base_memory,
+            "top_allocations": self.top_allocations,
+            "doctypes": sorted(self.doctypes, key=lambda d: d["peak_bytes"], reverse=True),
+        }
+
+
+def _ignore_filters():
+    return [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+
+
+def _json_bytes(value):
+    return len(dumps(value).encode("utf-8"))
+
+
+def nested_sizes(structure, top=TOP_NESTED):
+    """
+    Serialized size of every nested DocType in a generated structure.
+
+    Each DocType's own data is serialized once and the sizes of enclosing
+    DocTypes are summed from their children, so this stays linear in the size
+    of the structure even at infinite depth.
+
+    Args:
+        structure (dict): Output of generate_doctype_json
+        top (int): Number of entries to return
+
+    Returns:
+        list: ``{"path", "doctype", "bytes"}`` dicts, largest first. Sizes
+        include everything nested below the entry.
+    """
+    # Pre-order walk; sizes are then filled in reverse so children come first
+    order = []
+    stack = [(structure, "")]
+    while stack:
+        node, path = stack.pop()
+        order.append((node, path))
+        for section in NESTED_SECTIONS:
+            children = node.get(section)
+            if not isinstance(children, dict):
+                continue
+            for key, child in children.items():
+                if isinstance(child, dict):
+                    stack.append((child, f"{path}/{section}/{key}" if path else f"{section}/{key}"))
+
+    size_of = {}
+    for node, _path in reversed(order):
+        own = {
+            key: value
+            for key, value in node.items()
+            if not (key in NESTED_SECTIONS and isinstance(value, dict))
+        }
+        # Compact JSON members are joined by commas inside the braces
+        members = [_json_bytes(own) - 2] if own else []
+        for section in NESTED_SECTIONS:
+            children = node.get(section)
+            if not isinstance(children, dict):
+                continue
+            items = [
+                _json_bytes(key)
+                + 1
+                + (size_of[id(child)] if isinstance(child, dict) else _json_bytes(child))
+                for key, child in children.items()
+            ]
+            members.append(_json_bytes(section) + 1 + 2 + sum(items) + max(len(items) - 1, 0))
+        size_of[id(node)] = 2 + sum(members) + max(len(members) - 1, 0)
+
+    sizes = [
+        {
+            "path": path,
+            "doctype": node.get("doctype_name") or node.get("doctype"),
+            "bytes": size_of[id(node)],
+        }
+        for node, path in order[1:]
+    ]
+    sizes.sort(key=lambda s: s["bytes"], reverse=True)
+    return sizes[:top]
+
+
+def write_report(report, name="memory_profile"):
+    """
+    Save a profiling report to the site's private files.
+
+    Args:
+        report (dict): Output of MemoryProfiler.report
+        name (str): File name prefix
+
+    Returns:
+        str: Path of the written report
+    """
+    output_dir = frappe.get_site_path("private", "files", "doctype_docs")
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(
+        output_dir, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    with open(output_path, "w", encoding="utf-8") as f:
+        dump(report, f, pretty=True)
+    return output_path
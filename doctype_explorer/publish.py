@@ -0,0 +1,224 @@
+"""Precompressed static artifacts for get_doctype_api.
+
+When ``doctype_explorer_static_mode`` is set in ``site_config.json``, the
+warm-up jobs in ``tasks.py`` also write the complete API response body for
+each hot DocType and level, as ``.json`` plus a gzip-compressed ``.json.gz``.
+After checking the AUTH-KEY, get_doctype_api then hands published responses to
+nginx instead of building them in Python:
+
+    "redirect": 302 to the file's URL under the site's public files
+    "accel": X-Accel-Redirect to ``/protected/private/files/...``; the files
+             are private and only reachable through the API
+
+Artifacts are written to a directory named after a hash of the AUTH-KEY, so
+redirect URLs cannot be guessed without it. Published paths are recorded in a
+Redis hash that is cleared with the other schema caches, so a schema change
+stops the API from pointing at stale files straight away. Files that are no
+longer published (old AUTH-KEYs, DocTypes or levels dropped from the warm-up
+configuration, the other mode) are pruned whenever the warm-up runs.
+"""
+
+import gzip
+import hashlib
+import os
+import shutil
+from urllib.parse import quote
+
+import frappe
+from werkzeug.wrappers import Response
+
+from .cache import PUBLISHED_ARTIFACTS_CACHE_KEY, structure_cache_field
+from .serializers import dumps
+
+STATIC_MODES = ("redirect", "accel")
+
+# Site-relative root of the artifacts for each mode
+ARTIFACT_ROOTS = {
+    "redirect": "public/files/doctype_api",
+    "accel": "private/files/doctype_api",
+}
+
+
+def get_static_mode():
+    """
+    Return the configured static mode, or None when publishing is disabled.
+
+    Returns:
+        str | None: "redirect", "accel" or None
+    """
+    mode = frappe.conf.get("doctype_explorer_static_mode")
+    return mode if mode in STATIC_MODES else None
+
+
+def _token(auth_key):
+    return hashlib.sha256(f"doctype_explorer:{auth_key}".encode("utf-8")).hexdigest()[:32]
+
+
+def artifact_path(doctype_name, level, auth_key, mode):
+    """
+    Site-relative path of a published response.
+
+    Args:
+        doctype_name (str): DocType name
+        level (int): Requested depth (0 for infinite)
+        auth_key (str): Configured AUTH-KEY
+        mode (str): "redirect" or "accel"
+
+    Returns:
+        str: Path of the ``.json`` file relative to the site directory
+    """
+    filename = f"{doctype_name.replace(' ', '_')}.level{int(level or 0)}.json"
+    return f"{ARTIFACT_ROOTS[mode]}/{_token(auth_key)}/{filename}"
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def publish_structure(doctype_name, level, structure, auth_key, mode, stamp):
+    """
+    Write the get_doctype_api response for a structure as ``.json`` and
+    ``.json.gz``, then record it as published.
+
+    Args:
+        doctype_name (str): DocType name
+        level (int): Requested depth (0 for infinite)
+        structure (dict): Structure returned by ``get_doctype_structure``
+        auth_key (str): Configured AUTH-KEY
+        mode (str): "redirect" or "accel"
+        stamp (tuple): ``custom_perm_stamp()`` the structure was generated with
+
+    Returns:
+        str: Site-relative path of the ``.json`` file
+    """
+    level = int(level or 0)
+    body = dumps(
+        {
+            "success": True,
+            "data": structure,
+            "message": f"Documentation generated for {doctype_name}",
+            "doctype_name": doctype_name,
+            "level": level,
+        }
+    ).encode("utf-8")
+
+    relative_path = artifact_path(doctype_name, level, auth_key, mode)
+    path = frappe.get_site_path(relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Compressed once at the highest level; mtime=0 keeps output reproducible
+    _write_atomic(f"{path}.gz", gzip.compress(body, compresslevel=9, mtime=0))
+    _write_atomic(path, body)
+
+    frappe.cache().hset(
+        PUBLISHED_ARTIFACTS_CACHE_KEY,
+        structure_cache_field(doctype_name, level),
+        {"path": relative_path, "stamp": stamp},
+    )
+    return relative_path
+
+
+def get_published_artifact(doctype_name, level, auth_key, mode, stamp):
+    """
+    Return the site-relative path of a published response, or None if the
+    DocType and level have not been published for the current AUTH-KEY, mode
+    and Custom DocPerm rows since the last schema change.
+
+    Args:
+        doctype_name (str): DocType name
+        level (int): Requested depth (0 for infinite)
+        auth_key (str): Configured AUTH-KEY
+        mode (str): "redirect" or "accel"
+        stamp (tuple): Current ``custom_perm_stamp()``
+
+    Returns:
+        str | None: Path relative to the site directory
+    """
+    entry = frappe.cache().hget(
+        PUBLISHED_ARTIFACTS_CACHE_KEY, structure_cache_field(doctype_name, level)
+    )
+    if (
+        entry is None
+        or entry.get("stamp") != stamp
+        or entry.get("path") != artifact_path(doctype_name, level, auth_key, mode)
+    ):
+        return None
+    return entry["path"]
+
+
+def prune_artifacts(doctypes=(), levels=(), auth_key=None, mode=None):
+    """
+    Delete artifacts that are no longer published: directories of other
+    AUTH-KEYs, the other mode's root, and files for DocTypes or levels outside
+    the warm-up configuration. With no mode every artifact is deleted.
+
+    Args:
+        doctypes (list): DocTypes being published
+        levels (list): Levels being published
+        auth_key (str | None): Configured AUTH-KEY
+        mode (str | None): Configured static mode
+
+    Returns:
+        int: Number of files and directories deleted
+    """
+    keep_paths = set()
+    if mode and auth_key:
+        for doctype_name in doctypes:
+            for level in levels:
+                keep_paths.add(artifact_path(doctype_name, level, auth_key, mode))
+    # File names kept inside the current AUTH-KEY's directory
+    keep = {os.path.basename(path) for path in keep_paths}
+    keep |= {f"{name}.gz" for name in keep}
+
+    # Stop pointing the API at files that are about to be deleted
+    cache = frappe.cache()
+    for field, entry in (cache.hgetall(PUBLISHED_ARTIFACTS_CACHE_KEY) or {}).items():
+        if not entry or entry.get("path") not in keep_paths:
+            cache.hdel(PUBLISHED_ARTIFACTS_CACHE_KEY, frappe.safe_decode(field))
+
+    removed = 0
+    for root_mode, root in ARTIFACT_ROOTS.items():
+        root_path = frappe.get_site_path(root)
+        if not os.path.isdir(root_path):
+            continue
+        for entry in os.scandir(root_path):
+            if root_mode != mode or not auth_key or entry.name != _token(auth_key):
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    os.remove(entry.path)
+                removed += 1
+                continue
+            for artifact in os.scandir(entry.path):
+                if artifact.name not in keep and not artifact.name.endswith(".tmp"):
+                    os.remove(artifact.path)
+                    removed += 1
+    return removed
+
+
+def static_response(relative_path, mode):
+    """
+    Build a response that lets nginx serve a published artifact.
+
+    Args:
+        relative_path (str): Site-relative path of the artifact
+        mode (str): "redirect" or "accel"
+
+    Returns:
+        Response: 302 redirect or X-Accel-Redirect response
+    """
+    quoted = quote(relative_path)
+    if mode == "accel":
+        response = Response(mimetype="application/json", status=200)
+        response.headers["X-Accel-Redirect"] = f"/protected/{quoted}"
+        return response
+
+    response = Response(status=302)
+    # Public files are served from the site root without the "public" prefix
+    response.headers["Location"] = "/" + quoted.removeprefix("public/")
+    # The target changes whenever the schema does
+    response.headers["Cache-Control"] = "no-cache"
+    return response
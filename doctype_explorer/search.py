@@ -0,0 +1,286 @@
+"""Inverted index over the fields of every DocType.
+
+The index answers questions like "which DocTypes have a field named
+cost_center?" or "every Link field pointing to Warehouse" without generating
+documentation for each DocType.
+
+Field rows are kept per DocType in a Redis hash so DocType, Custom Field and
+Property Setter hooks can update a single DocType. Each worker builds the
+postings lists from that hash once per index version.
+"""
+
+import re
+import string
+from bisect import bisect_left
+
+import frappe
+
+from .bulk import load_fields
+
+INDEX_KEY = "doctype_explorer|field_index"
+INDEX_VERSION_KEY = "doctype_explorer|field_index_version"
+
+SEARCH_ATTRIBUTES = ("fieldname", "label", "fieldtype", "options", "description")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+FUZZY_ALPHABET = string.ascii_lowercase + string.digits + "_ "
+
+# Score per match kind; results are ranked by the sum over query tokens
+EXACT_SCORE = 3
+TOKEN_SCORE = 2
+PREFIX_SCORE = 1
+FUZZY_SCORE = 0.5
+
+# site -> (index version, built index)
+_local_indexes = {}
+
+
+def _field_rows(fields):
+    """Reduce bulk-loaded fields to the tuples stored in the index hash."""
+    return [
+        (
+            f["fieldname"],
+            f["label"] or "",
+            f["fieldtype"],
+            f["options"] or "",
+            f["description"] or "",
+            f["is_custom"],
+        )
+        for f in fields
+    ]
+
+
+def _tokenize(value):
+    """Return the lowercased full value plus its alphanumeric words."""
+    value = (value or "").strip().lower()
+    if not value:
+        return set()
+    tokens = set(TOKEN_PATTERN.findall(value))
+    tokens.add(value)
+    return tokens
+
+
+def rebuild_field_index():
+    """
+    Rebuild the field index for every DocType from bulk queries.
+
+    Returns:
+        str: New index version
+    """
+    cache = frappe.cache()
+    cache.delete_value(INDEX_KEY)
+    for doctype, fields in load_fields().items():
+        cache.hset(INDEX_KEY, doctype, _field_rows(fields))
+    return _bump_version()
+
+
+def _bump_version():
+    version = frappe.generate_hash(length=10)
+    frappe.cache().set_value(INDEX_VERSION_KEY, version)
+    return version
+
+
+def update_field_index(doc, method=None):
+    """
+    Reindex the DocType touched by a DocType, Custom Field or Property Setter
+    change. Registered in ``doc_events``. Does nothing during migrate and app
+    install, where ``after_migrate`` rebuilds the whole index once.
+
+    Args:
+        doc (Document): Document that triggered the hook
+        method (str | None): Hook method name
+    """
+    if frappe.flags.in_migrate or frappe.flags.in_install:
+        return
+
+    # Nothing to maintain until the index has been built once
+    if not frappe.cache().get_value(INDEX_VERSION_KEY):
+        return
+
+    if doc.doctype == "DocType":
+        doctype = doc.name
+    elif doc.doctype == "Custom Field":
+        doctype = doc.dt
+    else:
+        doctype = doc.doc_type
+
+    fields = load_fields([doctype]).get(doctype)
+    if not fields or (method == "after_delete" and doc.doctype == "DocType"):
+        frappe.cache().hdel(INDEX_KEY, doctype)
+    else:
+        frappe.cache().hset(INDEX_KEY, doctype, _field_rows(fields))
+
+    _bump_version()
+
+
+def _get_index():
+    """Return this worker's postings, rebuilding them when the version changed."""
+    version = frappe.cache().get_value(INDEX_VERSION_KEY) or rebuild_field_index()
+
+    cached = _local_indexes.get(frappe.local.site)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    entries = []
+    for doctype, rows in frappe.cache().hgetall(INDEX_KEY).items():
+        doctype = frappe.safe_decode(doctype)
+        entries.extend((doctype, *row) for row in rows)
+    entries.sort()
+
+    postings = {attr: {} for attr in SEARCH_ATTRIBUTES}
+    for entry_id, entry in enumerate(entries):
+        for position, attr in enumerate(SEARCH_ATTRIBUTES, start=1):
+            for token in _tokenize(entry[position]):
+                postings[attr].setdefault(token, []).append(entry_id)
+
+    index = {
+        "entries": entries,
+        "postings": postings,
+        "vocabulary": {attr: sorted(postings[attr]) for attr in SEARCH_ATTRIBUTES},
+    }
+    _local_indexes[frappe.local.site] = (version, index)
+    return index
+
+
+def _edits(token):
+    """All strings one edit (delete, transpose, replace, insert) away from token."""
+    splits = [(token[:i], token[i:]) for i in range(len(token) + 1)]
+    deletes = [a + b[1:] for a, b in splits if b]
+    transposes = [a + b[1] + b[0] + b[2:] for a, b in splits if len(b) > 1]
+    replaces = [a + c + b[1:] for a, b in splits if b for c in FUZZY_ALPHABET]
+    inserts = [a + c + b for a, b in splits for c in FUZZY_ALPHABET]
+    return set(deletes + transposes + replaces + inserts)
+
+
+def _match_token(index, attr, token, prefix, fuzzy):
+    """Return {entry_id: score} for one query token against one attribute."""
+    postings = index["postings"][attr]
+    scores = {}
+
+    def add(matched, score):
+        for entry_id in postings[matched]:
+            if scores.get(entry_id, 0) < score:
+                scores[entry_id] = score
+
+    if token in postings:
+        add(token, TOKEN_SCORE)
+
+    if prefix:
+        vocabulary = index["vocabulary"][attr]
+        position = bisect_left(vocabulary, token)
+        while position < len(vocabulary) and vocabulary[position].startswith(token):
+            if vocabulary[position] != token:
+                add(vocabulary[position], PREFIX_SCORE)
+            position += 1
+
+    if fuzzy and len(token) > 3:
+        for candidate in _edits(token):
+            if candidate in postings:
+                add(candidate, FUZZY_SCORE)
+
+    return scores
+
+
+@frappe.whitelist()
+def search_fields(
+    query=None,
+    fieldtype=None,
+    options=None,
+    search_in=None,
+    prefix=True,
+    fuzzy=False,
+    limit=50,
+):
+    """
+    Search the fields of every DocType, including custom fields.
+
+    Args:
+        query (str | None): Text matched against the searched attributes
+        fieldtype (str | None): Only return fields of this type (e.g. "Link")
+        options (str | None): Only return fields with these options (e.g. "Warehouse")
+        search_in (list | str | None): Attributes to search, any of fieldname, label,
+            fieldtype, options, description (default: all)
+        prefix (bool): Match query words as prefixes
+        fuzzy (bool): Also match words one typo away
+        limit (int): Maximum number of results (0 for all)
+
+    Returns:
+        dict: Matching fields ranked by relevance
+    """
+    try:
+        if isinstance(search_in, str):
+            search_in = (
+                frappe.parse_json(search_in)
+                if search_in.startswith("[")
+                else [a.strip() for a in search_in.split(",")]
+            )
+        attributes = [a for a in (search_in or SEARCH_ATTRIBUTES) if a in SEARCH_ATTRIBUTES]
+        prefix = frappe.utils.cstr(prefix).lower() in {"true", "1"}
+        fuzzy = frappe.utils.cstr(fuzzy).lower() in {"true", "1"}
+        limit = frappe.utils.cint(limit)
+
+        index = _get_index()
+        entries = index["entries"]
+
+        query_value = (query or "").strip().lower()
+        if query_value:
+            query_tokens = TOKEN_PATTERN.findall(query_value) or [query_value]
+            scores = None
+            for token in query_tokens:
+                token_scores = {}
+                for attr in attributes:
+                    for entry_id, score in _match_token(index, attr, token, prefix, fuzzy).items():
+                        token_scores[entry_id] = max(token_scores.get(entry_id, 0), score)
+                # Every query word must match somewhere
+                scores = (
+                    token_scores
+                    if scores is None
+                    else {
+                        entry_id: scores[entry_id] + score
+                        for entry_id, score in token_scores.items()
+                        if entry_id in scores
+                    }
+                )
+            # Boost fields whose whole value equals the query
+            for attr in attributes:
+                for entry_id in index["postings"][attr].get(query_value, []):
+                    if entry_id in scores:
+                        scores[entry_id] += EXACT_SCORE
+        elif options:
+            scores = dict.fromkeys(index["postings"]["options"].get(options.strip().lower(), []), 0)
+        elif fieldtype:
+            scores = dict.fromkeys(index["postings"]["fieldtype"].get(fieldtype.strip().lower(), []), 0)
+        else:
+            return {"success": False, "message": "Provide a query, fieldtype or options to search"}
+
+        fieldtype_filter = (fieldtype or "").strip().lower()
+        options_filter = (options or "").strip().lower()
+
+        results = []
+        for entry_id, score in scores.items():
+            doctype, fieldname, label, ftype, opts, description, is_custom = entries[entry_id]
+            if fieldtype_filter and ftype.lower() != fieldtype_filter:
+                continue
+            if options_filter and opts.lower() != options_filter:
+                continue
+            results.append(
+                {
+                    "doctype": doctype,
+                    "fieldname": fieldname,
+                    "label": label,
+                    "fieldtype": ftype,
+                    "options": opts,
+                    "description": description,
+                    "is_custom": bool(is_custom),
+                    "score": score,
+                }
+            )
+
+        results.sort(key=lambda r: (-r["score"], r["doctype"], r["fieldname"]))
+        total = len(results)
+        if limit > 0:
+            results = results[:limit]
+
+        return {"success": True, "results": results, "total": total}
+    except Exception as e:  # noqa: BLE001
+        return {"success": False, "message": str(e)}
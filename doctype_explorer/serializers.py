@@ -0,0 +1,74 @@
+"""JSON serialization for explorer output.
+
+Uses orjson when it is installed (``pip install doctype_explorer[fast]``) and
+falls back to the standard library otherwise. Both backends write compact
+output without ASCII escaping, with ``(",", ":")`` separators, and with
+``str()`` for values JSON cannot represent (datetimes included). Strings,
+integers, booleans, null and those values come out as the same text.
+
+Floats do not: orjson writes exponents as ``1e20`` and ``1e-7`` where the
+standard library writes ``1e+20`` and ``1e-07``, although both parse back to
+the same number. NaN and infinity become ``null`` with orjson and the
+non-standard ``NaN``/``Infinity`` tokens with the standard library. Explorer
+structures hold no floats, so their output matches in practice.
+
+This module does not import frappe so it can be benchmarked on its own.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+BACKENDS = ("orjson", "json") if orjson else ("json",)
+DEFAULT_BACKEND = BACKENDS[0]
+
+if orjson:
+    # Datetimes go through `default=str` like the stdlib backend instead of
+    # orjson's native RFC 3339 output
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _stdlib_dumps(obj, pretty):
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def dumps(obj, pretty=False, backend=None):
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        pretty (bool): Indent with 2 spaces instead of compact output
+        backend (str | None): "orjson" or "json" (default: fastest available)
+
+    Returns:
+        str: JSON text
+    """
+    if (backend or DEFAULT_BACKEND) == "orjson":
+        option = ORJSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else ORJSON_OPTIONS
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+        except TypeError:
+            # e.g. integers above 64 bits; the stdlib handles these
+            pass
+    return _stdlib_dumps(obj, pretty)
+
+
+def dump(obj, fp, pretty=False, backend=None):
+    """
+    Serialize an object as JSON to a text file object.
+
+    Args:
+        obj: Object to serialize
+        fp: File object opened in text mode
+        pretty (bool): Indent with 2 spaces instead of compact output
+        backend (str | None): "orjson" or "json" (default: fastest available)
+    """
+    fp.write(dumps(obj, pretty=pretty, backend=backend))
@@ -0,0 +1,262 @@
+"""Export the whole site's schema to one indexed SQLite file.
+
+The file holds DocTypes, fields, links, child tables and permissions as plain
+tables, so they can be joined offline without touching the site. Rows come
+from the bulk loaders. They are inserted in batches inside one transaction,
+and indexes are created once the data is in. The database is built in a
+temporary file next to the target and moved into place at the end, so readers
+never see a partial export.
+"""
+
+import os
+import sqlite3
+from datetime import datetime
+
+import frappe
+
+from .bulk import TABLE_FIELDTYPES, load_fields
+from .permissions import PERMISSION_RIGHTS, _load_permissions
+
+BATCH_SIZE = 5000
+
+DOCTYPE_COLUMNS = (
+    "name",
+    "module",
+    "istable",
+    "issingle",
+    "is_submittable",
+    "is_tree",
+    "custom",
+    "track_changes",
+    "autoname",
+)
+
+SCHEMA = f"""
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE doctypes (
+    name TEXT PRIMARY KEY,
+    module TEXT,
+    istable INTEGER,
+    issingle INTEGER,
+    is_submittable INTEGER,
+    is_tree INTEGER,
+    custom INTEGER,
+    track_changes INTEGER,
+    autoname TEXT
+);
+CREATE TABLE fields (
+    doctype TEXT NOT NULL,
+    idx INTEGER,
+    fieldname TEXT,
+    label TEXT,
+    fieldtype TEXT,
+    options TEXT,
+    reqd INTEGER,
+    is_unique INTEGER,
+    description TEXT,
+    is_custom INTEGER
+);
+CREATE TABLE links (
+    doctype TEXT NOT NULL,
+    fieldname TEXT,
+    target TEXT NOT NULL
+);
+CREATE TABLE child_tables (
+    parent TEXT NOT NULL,
+    fieldname TEXT,
+    fieldtype TEXT,
+    child TEXT NOT NULL
+);
+CREATE TABLE permissions (
+    doctype TEXT NOT NULL,
+    role TEXT NOT NULL,
+    permlevel INTEGER,
+    {", ".join(f'"{right}" INTEGER' for right in PERMISSION_RIGHTS)}
+);
+"""
+
+INDEXES = """
+CREATE INDEX fields_doctype ON fields (doctype);
+CREATE INDEX fields_fieldname ON fields (fieldname);
+CREATE INDEX fields_fieldtype ON fields (fieldtype);
+CREATE INDEX links_doctype ON links (doctype);
+CREATE INDEX links_target ON links (target);
+CREATE INDEX child_tables_parent ON child_tables (parent);
+CREATE INDEX child_tables_child ON child_tables (child);
+CREATE INDEX permissions_doctype ON permissions (doctype);
+CREATE INDEX permissions_role ON permissions (role);
+"""
+
+
+def _insert(cursor, table, columns, rows):
+    """Insert rows from an iterable in batches."""
+    statement = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            cursor.executemany(statement, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        cursor.executemany(statement, batch)
+        count += len(batch)
+    return count
+
+
+def _field_rows(fields_by_doctype):
+    for doctype, fields in fields_by_doctype.items():
+        for f in fields:
+            yield (
+                doctype,
+                f.get("idx"),
+                f.get("fieldname"),
+                f.get("label"),
+                f.get("fieldtype"),
+                f.get("options"),
+                f.get("reqd") or 0,
+                f.get("unique") or 0,
+                f.get("description"),
+                f.get("is_custom") or 0,
+            )
+
+
+def _link_rows(fields_by_doctype):
+    for doctype, fields in fields_by_doctype.items():
+        for f in fields:
+            if f.get("fieldtype") == "Link" and f.get("options"):
+                yield (doctype, f.get("fieldname"), f["options"])
+
+
+def _child_table_rows(fields_by_doctype):
+    for doctype, fields in fields_by_doctype.items():
+        for f in fields:
+            if f.get("fieldtype") in TABLE_FIELDTYPES and f.get("options"):
+                yield (doctype, f.get("fieldname"), f["fieldtype"], f["options"])
+
+
+def _permission_rows(perms):
+    for doctype, rows in sorted(perms.items()):
+        for row in rows:
+            yield (
+                doctype,
+                row.role,
+                row.permlevel or 0,
+                *(1 if row.get(right) else 0 for right in PERMISSION_RIGHTS),
+            )
+
+
+def write_schema_sqlite(output_path):
+    """
+    Write every DocType's schema on the connected site to a SQLite file.
+
+    Args:
+        output_path (str): Path of the SQLite file (replaced if it exists)
+
+    Returns:
+        dict: Number of rows written per table
+    """
+    doctypes = frappe.get_all("DocType", fields=list(DOCTYPE_COLUMNS), order_by="name asc")
+    fields_by_doctype = load_fields()
+    perms = _load_permissions()
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    try:
+        # The file is only moved into place once complete, so skip the journal
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        for statement in SCHEMA.split(";"):
+            if statement.strip():
+                cursor.execute(statement)
+
+        counts = {
+            "doctypes": _insert(
+                cursor,
+                "doctypes",
+                DOCTYPE_COLUMNS,
+                (tuple(dt.get(column) for column in DOCTYPE_COLUMNS) for dt in doctypes),
+            ),
+            "fields": _insert(
+                cursor,
+                "fields",
+                (
+                    "doctype",
+                    "idx",
+                    "fieldname",
+                    "label",
+                    "fieldtype",
+                    "options",
+                    "reqd",
+                    "is_unique",
+                    "description",
+                    "is_custom",
+                ),
+                _field_rows(fields_by_doctype),
+            ),
+            "links": _insert(
+                cursor, "links", ("doctype", "fieldname", "target"), _link_rows(fields_by_doctype)
+            ),
+            "child_tables": _insert(
+                cursor,
+                "child_tables",
+                ("parent", "fieldname", "fieldtype", "child"),
+                _child_table_rows(fields_by_doctype),
+            ),
+            "permissions": _insert(
+                cursor,
+                "permissions",
+                ("doctype", "role", "permlevel", *(f'"{right}"' for right in PERMISSION_RIGHTS)),
+                _permission_rows(perms),
+            ),
+        }
+        _insert(
+            cursor,
+            "meta",
+            ("key", "value"),
+            [("site", frappe.local.site), ("generated_at", datetime.now().isoformat())],
+        )
+
+        for statement in INDEXES.split(";"):
+            if statement.strip():
+                cursor.execute(statement)
+        cursor.execute("COMMIT")
+    except BaseException:
+        conn.close()
+        os.remove(tmp_path)
+        raise
+    conn.close()
+
+    os.replace(tmp_path, output_path)
+    return counts
+
+
+@frappe.whitelist()
+def export_schema_sqlite():
+    """
+    Export DocTypes, fields, links, child tables and permissions of the whole
+    site to an indexed SQLite file for offline querying.
+
+    The file is written to the site's private files since it includes
+    permissions.
+
+    Returns:
+        dict: Path to the SQLite file and rows written per table
+    """
+    frappe.only_for("System Manager")
+    try:
+        output_path = frappe.get_site_path("private", "files", "doctype_docs", "schema.sqlite3")
+        counts = write_schema_sqlite(output_path)
+        return {"success": True, "file_path": output_path, "counts": counts}
+    except Exception as e:  # noqa: BLE001
+        return {"success": False, "message": str(e)}
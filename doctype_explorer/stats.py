@@ -0,0 +1,140 @@
+"""Site-wide schema statistics computed from bulk field data."""
+
+import frappe
+
+from .bulk import TABLE_FIELDTYPES, get_doctypes, load_fields
+from .cache import STATISTICS_CACHE_KEY
+
+
+def compute_schema_statistics():
+    """
+    Compute schema statistics for every DocType in a single pass over bulk
+    loaded fields.
+
+    Returns:
+        dict: Site totals, per-module summaries with fieldtype histograms, and
+        full rankings for links and child tables
+    """
+    doctypes = get_doctypes()
+    fields_by_doctype = load_fields()
+
+    totals = {
+        "doctypes": len(doctypes),
+        "child_tables": 0,
+        "single_doctypes": 0,
+        "custom_doctypes": 0,
+        "fields": 0,
+        "custom_fields": 0,
+        "required_fields": 0,
+        "unique_fields": 0,
+        "link_fields": 0,
+        "table_fields": 0,
+    }
+    modules = {}
+    outgoing_links = {}
+    incoming_links = {}
+    child_tables_by_parent = {}
+    parents_by_child_table = {}
+
+    for dt in doctypes:
+        module = modules.setdefault(
+            dt.module,
+            {
+                "doctypes": 0,
+                "fields": 0,
+                "required_fields": 0,
+                "unique_fields": 0,
+                "fieldtypes": {},
+            },
+        )
+        module["doctypes"] += 1
+        totals["child_tables"] += 1 if dt.istable else 0
+        totals["single_doctypes"] += 1 if dt.issingle else 0
+        totals["custom_doctypes"] += 1 if dt.custom else 0
+
+        for field in fields_by_doctype.get(dt.name, ()):
+            fieldtype = field["fieldtype"]
+            module["fields"] += 1
+            module["fieldtypes"][fieldtype] = module["fieldtypes"].get(fieldtype, 0) + 1
+            totals["fields"] += 1
+            totals["custom_fields"] += 1 if field["is_custom"] else 0
+
+            if field["reqd"]:
+                module["required_fields"] += 1
+                totals["required_fields"] += 1
+            if field["unique"]:
+                module["unique_fields"] += 1
+                totals["unique_fields"] += 1
+
+            target = field["options"]
+            if not target:
+                continue
+            if fieldtype == "Link":
+                totals["link_fields"] += 1
+                outgoing_links[dt.name] = outgoing_links.get(dt.name, 0) + 1
+                incoming_links[target] = incoming_links.get(target, 0) + 1
+            elif fieldtype in TABLE_FIELDTYPES:
+                totals["table_fields"] += 1
+                child_tables_by_parent[dt.name] = child_tables_by_parent.get(dt.name, 0) + 1
+                parents_by_child_table.setdefault(target, set()).add(dt.name)
+
+    def ranking(counts, key):
+        return [
+            {"doctype": doctype, key: count}
+            for doctype, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+    linked = set(outgoing_links) | set(incoming_links) | set(child_tables_by_parent)
+    orphaned_doctypes = [dt.name for dt in doctypes if not dt.istable and dt.name not in linked]
+    unused_child_tables = [
+        dt.name for dt in doctypes if dt.istable and dt.name not in parents_by_child_table
+    ]
+
+    return {
+        "totals": totals,
+        "modules": dict(sorted(modules.items(), key=lambda item: item[0] or "")),
+        "most_links": ranking(outgoing_links, "link_fields"),
+        "most_linked_to": ranking(incoming_links, "incoming_links"),
+        "child_table_fanout": ranking(child_tables_by_parent, "child_tables"),
+        "child_table_reuse": ranking(
+            {child: len(parents) for child, parents in parents_by_child_table.items()},
+            "parent_doctypes",
+        ),
+        "orphaned_doctypes": orphaned_doctypes,
+        "unused_child_tables": unused_child_tables,
+    }
+
+
+@frappe.whitelist()
+def get_schema_statistics(module=None, top=20, refresh=False):
+    """
+    Get site-wide schema statistics. Results are cached until the schema changes.
+
+    Args:
+        module (str | None): Only return the summary of this module
+        top (int): Number of entries in each ranking (0 for all)
+        refresh (bool): Recompute instead of using the cached statistics
+
+    Returns:
+        dict: Statistics with totals, per-module fieldtype histograms, required
+        and unique field counts, link and child-table rankings, and orphaned
+        DocTypes
+    """
+    try:
+        if frappe.utils.cstr(refresh).lower() in {"true", "1"}:
+            frappe.cache().delete_value(STATISTICS_CACHE_KEY)
+        statistics = dict(
+            frappe.cache().get_value(STATISTICS_CACHE_KEY, generator=compute_schema_statistics)
+        )
+
+        top = frappe.utils.cint(top)
+        if top > 0:
+            for key in ("most_links", "most_linked_to", "child_table_fanout", "child_table_reuse"):
+                statistics[key] = statistics[key][:top]
+
+        if module:
+            statistics["modules"] = {module: statistics["modules"].get(module, {})}
+
+        return {"success": True, "statistics": statistics}
+    except Exception as e:  # noqa: BLE001
+        return {"success": False, "message": str(e)}
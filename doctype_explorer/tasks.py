@@ -0,0 +1,184 @@
+"""Background and scheduled jobs for DocType Explorer.
+
+Cache warm-up is configured in ``site_config.json``:
+
+    doctype_explorer_warm_doctypes (list): DocTypes to precompute
+    doctype_explorer_warm_modules (list): Modules whose DocTypes are precomputed
+    doctype_explorer_warm_levels (list): Depth levels to precompute (default: [0])
+    doctype_explorer_warm_chunk_size (int): DocTypes per background job (default: 20)
+    doctype_explorer_static_mode (str): "redirect" or "accel" to also publish
+        precompressed API responses for warmed DocTypes (see publish.py)
+"""
+
+import frappe
+
+from .cache import clear_schema_cache, custom_perm_stamp, get_cached_structure
+from .explorer import get_auth_key, get_doctype_structure
+from .publish import (
+    get_published_artifact,
+    get_static_mode,
+    prune_artifacts,
+    publish_structure,
+)
+
+
+def get_warm_doctypes():
+    """
+    Resolve the configured hot DocTypes and modules into a list of DocType names.
+
+    Returns:
+        list: DocType names, configured DocTypes first, without duplicates
+    """
+    doctypes = list(frappe.conf.get("doctype_explorer_warm_doctypes") or [])
+    modules = frappe.conf.get("doctype_explorer_warm_modules") or []
+
+    if modules:
+        # One query for every configured module instead of one per module
+        doctypes += frappe.get_all(
+            "DocType", filters={"module": ["in", modules]}, pluck="name", order_by="name"
+        )
+
+    return list(dict.fromkeys(doctypes))
+
+
+def get_warm_levels():
+    """
+    Return the configured depth levels to precompute.
+
+    Returns:
+        list: Depth levels (0 for infinite)
+    """
+    return [int(level) for level in (frappe.conf.get("doctype_explorer_warm_levels") or [0])]
+
+
+def warm_structure_cache(only_missing=True):
+    """
+    Enqueue background jobs that precompute structures for the hot DocTypes.
+
+    Work is split into chunks so it is spread across the available workers.
+    Scheduled hourly to refill entries dropped by schema changes. Published
+    static artifacts that are no longer configured are pruned first.
+
+    Args:
+        only_missing (bool): Skip DocTypes whose structures are already cached
+
+    Returns:
+        int: Number of jobs enqueued
+    """
+    doctypes = get_warm_doctypes()
+    levels = get_warm_levels()
+
+    mode = get_static_mode()
+    prune_artifacts(doctypes, levels, get_auth_key() if mode else None, mode)
+
+    if not doctypes:
+        return 0
+
+    chunk_size = int(frappe.conf.get("doctype_explorer_warm_chunk_size") or 20)
+
+    jobs = 0
+    for start in range(0, len(doctypes), chunk_size):
+        frappe.enqueue(
+            "doctype_explorer.tasks.warm_doctypes",
+            queue="long",
+            doctypes=doctypes[start : start + chunk_size],
+            levels=levels,
+            only_missing=only_missing,
+        )
+        jobs += 1
+
+    return jobs
+
+
+def warm_doctypes(doctypes, levels=None, only_missing=True):
+    """
+    Background job: generate and cache structures for a chunk of DocTypes, and
+    publish their API responses when static mode is enabled.
+
+    Args:
+        doctypes (list): DocType names
+        levels (list | None): Depth levels to precompute (default: [0])
+        only_missing (bool): Skip DocTypes whose structures are already cached
+            (and published)
+    """
+    mode = get_static_mode()
+    auth_key = get_auth_key() if mode else None
+    stamp = custom_perm_stamp()
+
+    # Structures are built from get_meta rather than the bulk loaders: they
+    # document field and DocType properties the bulk loaders do not read, and
+    # custom fields must sit where get_meta places them. get_meta is itself
+    # cached, so DocTypes shared between link closures are read from the
+    # database once.
+    for doctype_name in doctypes:
+        for level in levels or [0]:
+            if (
+                only_missing
+                and get_cached_structure(doctype_name, level, stamp) is not None
+                and (not auth_key or get_published_artifact(doctype_name, level, auth_key, mode, stamp))
+            ):
+                continue
+            try:
+                structure = get_doctype_structure(doctype_name, level)
+                if auth_key:
+                    publish_structure(doctype_name, level, structure, auth_key, mode, stamp)
+            except Exception as e:  # noqa: BLE001
+                frappe.log_error(
+                    f"Error warming cache for {doctype_name} (level {level}): {str(e)}",
+                    "DocType Explorer Cache Warm-up",
+                )
+
+
+def _enqueue_outside_migrate(method, **kwargs):
+    """
+    Enqueue a job from a migrate hook. ``frappe.enqueue`` runs jobs inline
+    while ``frappe.flags.in_migrate`` is set, so the flag is cleared around the
+    call to hand the job to a background worker instead.
+    """
+    in_migrate = frappe.flags.in_migrate
+    frappe.flags.in_migrate = False
+    try:
+        frappe.enqueue(method, **kwargs)
+    finally:
+        frappe.flags.in_migrate = in_migrate
+
+
+def after_migrate():
+    """
+    Drop structures generated against the old schema, then precompute the hot
+    DocTypes and rebuild the field search index in background jobs so the
+    first request after a deploy is served from cache without slowing down
+    ``bench migrate``.
+    """
+    clear_schema_cache()
+    _enqueue_outside_migrate(
+        "doctype_explorer.tasks.warm_structure_cache", queue="long", only_missing=False
+    )
+    _enqueue_outside_migrate("doctype_explorer.search.rebuild_field_index", queue="long")
+
+
+def republish_after_schema_change(doc=None, method=None):
+    """
+    Regenerate the published API responses once a schema change commits.
+
+    Registered as a document hook next to ``clear_schema_cache``, which has
+    already stopped the API from serving the stale files. Does nothing unless
+    static mode is enabled, or during migrate and app install, where
+    ``after_migrate`` republishes everything once. Saves made in quick
+    succession share one queued warm-up.
+
+    Args:
+        doc (Document | None): Document that triggered the hook
+        method (str | None): Hook method name
+    """
+    if not get_static_mode() or frappe.flags.in_migrate or frappe.flags.in_install:
+        return
+
+    frappe.enqueue(
+        "doctype_explorer.tasks.warm_structure_cache",
+        queue="long",
+        job_id="doctype_explorer_republish",
+        deduplicate=True,
+        enqueue_after_commit=True,
+        only_missing=True,
+    )